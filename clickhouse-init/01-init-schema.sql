@@ -125,6 +125,32 @@ CREATE TABLE IF NOT EXISTS collection_metrics (
 ORDER BY (metric_time, source)
 PARTITION BY toYYYYMM(metric_time);
 
+-- Per-minute rollup of collection_metrics (for the /health endpoint)
+--
+-- A materialized view runs its SELECT on every block of rows inserted into
+-- collection_metrics and stores the result, so the aggregation is kept up to
+-- date incrementally instead of being recomputed from raw rows on every
+-- health check. AggregatingMergeTree stores partial aggregate states
+-- (maxState, sumState, avgState); queries finish them with the matching
+-- -Merge combinators (maxMerge, sumMerge, avgMerge). /health then reads a
+-- few rows per source (one per minute) instead of scanning raw metrics.
+-- Only the recent window is ever queried, so old minutes expire after a day.
+-- The collector repeats this statement on startup (COLLECTION_METRICS_VIEW_DDL
+-- in collector/main.py) for databases created before the view existed.
+CREATE MATERIALIZED VIEW IF NOT EXISTS collection_metrics_5min
+ENGINE = AggregatingMergeTree()
+ORDER BY (source, minute)
+TTL minute + INTERVAL 1 DAY
+AS SELECT
+    source,
+    toStartOfMinute(metric_time) AS minute,
+    maxState(metric_time) AS last_collect_state,
+    sumState(records_collected) AS records_state,
+    sumState(error_count) AS errors_state,
+    avgState(collection_duration_ms) AS duration_state
+FROM collection_metrics
+GROUP BY source, minute;
+
 -- Collection State Table (for tracking collection status)
 CREATE TABLE IF NOT EXISTS collection_state (
     id UInt8 DEFAULT 1 CODEC(ZSTD(3)),
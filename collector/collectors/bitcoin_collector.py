@@ -51,24 +51,148 @@ new UTXOs (outputs).
 """
 
 import logging
+import time
 from datetime import datetime
+from operator import itemgetter
+from typing import NamedTuple
 import aiohttp
 import asyncio
+import orjson
+from cachetools import LRUCache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
-from .data_validator import DataValidator, log_quality_issue
+from .data_validator import DataValidator, flush_quality_issues, log_quality_issue
 
 logger = logging.getLogger(__name__)
 
 
+class BitcoinBlockRow(NamedTuple):
+    """One bitcoin_blocks row. Field order matches the ClickHouse column order."""
+    block_height: int
+    block_hash: str
+    timestamp: int              # Epoch seconds; ClickHouse DateTime accepts it directly
+    previous_block_hash: str
+    merkle_root: str
+    difficulty: int
+    nonce: int
+    size: int
+    weight: int
+    transaction_count: int
+
+
+# Column order for ClickHouse inserts. Rows are passed as sequences rather than dicts
+# because clickhouse_connect requires explicit columns when a table has DEFAULT columns.
+# Defined once at import time as immutable tuples instead of being rebuilt per collect().
+_BLOCK_COLUMNS: tuple[str, ...] = BitcoinBlockRow._fields
+_TX_COLUMNS: tuple[str, ...] = (
+    'tx_hash', 'block_height', 'block_hash', 'size',
+    'weight', 'fee', 'input_count', 'output_count', 'timestamp'
+)
+
+_METRICS_COLUMNS: tuple[str, ...] = (
+    'metric_time', 'source', 'records_collected', 'collection_duration_ms',
+    'error_count', 'error_message'
+)
+
+# EDUCATIONAL NOTE - Server-Side Async Inserts:
+# With async_insert=1 ClickHouse collects small inserts in an in-memory buffer and
+# writes them out as one part, instead of creating a part per INSERT. We use it for
+# the low-volume collection_metrics writes. wait_for_async_insert=0 returns
+# immediately, so a failed async flush is only visible in the server logs, which is
+# acceptable for monitoring rows.
+_ASYNC_INSERT_SETTINGS = {
+    'async_insert': 1,
+    'wait_for_async_insert': 0,
+    'async_insert_max_data_size': 1_000_000,
+    'async_insert_busy_timeout_ms': 200,
+}
+
+# itemgetter pulls all columns out of a record dict in one C-level call,
+# returning a tuple in column order
+_TX_GETTER = itemgetter(*_TX_COLUMNS)
+
+# Default timeout for every Blockstream request, applied at the session level
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Retry policy for Blockstream API calls
+MAX_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 300  # Never sleep longer than 5 minutes on a Retry-After
+_backoff = wait_exponential_jitter(initial=1, max=60)
+
+
+# Returned instead of a body when the server answers a conditional GET with 304
+NOT_MODIFIED = object()
+
+
+class RateLimited(Exception):
+    """Raised on HTTP 429 so the retry policy can honor the server's Retry-After."""
+
+    def __init__(self, retry_after: float | None):
+        super().__init__(f"Rate limited by Blockstream API (Retry-After: {retry_after})")
+        self.retry_after = retry_after
+
+
+# Failures worth retrying: timeouts, connection/HTTP errors and rate limiting
+_TRANSIENT_EXC = (asyncio.TimeoutError, aiohttp.ClientError, RateLimited)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds; other forms fall back to backoff."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _wait_for_retry(retry_state) -> float:
+    """Wait Retry-After seconds when rate limited, otherwise jittered exponential backoff."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimited) and exc.retry_after is not None:
+        return min(exc.retry_after, MAX_RETRY_AFTER_SECONDS)
+    return _backoff(retry_state)
+
+
+def _log_retry(retry_state) -> None:
+    """Log each failed attempt before tenacity sleeps and retries."""
+    url = retry_state.args[2]  # _do_get(self, session, url, return_type)
+    exc = retry_state.outcome.exception()
+    logger.warning(
+        f"Error on {url}: {exc!r}, attempt {retry_state.attempt_number}/{MAX_RETRIES}, "
+        f"retrying in {retry_state.next_action.sleep:.1f}s"
+    )
+
+
 class BitcoinCollector:
     """
     Collects block and transaction data from the Bitcoin blockchain.
 
     Bitcoin was the first cryptocurrency (2009) and uses Proof-of-Work consensus
     where miners compete to find a valid block hash by adjusting the nonce.
+
+    Rows are buffered and written in batches (see _maybe_flush). The ClickHouse
+    client passed to collect() is expected to have transport compression enabled
+    (compress='lz4', see get_clickhouse_client in main.py): batches full of
+    repeated block hashes compress very well.
     """
 
-    def __init__(self, rpc_url: str, enabled: bool = True):
+    # Default maximum number of /tx requests in flight at once (matches
+    # limit_per_host); the scheduler can override it with rpc_concurrency
+    TX_FETCH_CONCURRENCY = 8
+    # Number of confirmed /tx responses kept in memory (see collect())
+    TX_CACHE_SIZE = 2048
+
+    # Insert buffering: flush once this many tx rows are pending or the oldest
+    # pending row is this many seconds old, whichever comes first
+    FLUSH_MAX_ROWS = 1000
+    FLUSH_MAX_AGE_SECONDS = 10.0
+    # Upper bound on rows sent in a single INSERT statement
+    INSERT_MAX_ROWS = 25_000
+    # collection_metrics rows (one per collect()) are buffered separately. The age
+    # limit stays well below the 60s freshness window used by the /health endpoint.
+    METRICS_FLUSH_MAX_ROWS = 100
+    METRICS_FLUSH_MAX_AGE_SECONDS = 30.0
+
+    def __init__(self, rpc_url: str, enabled: bool = True, rpc_concurrency: int | None = None):
         """
         Initialize the Bitcoin collector.
 
@@ -84,84 +208,278 @@ class BitcoinCollector:
         Args:
             rpc_url: Base URL for the Blockstream API (e.g., https://blockstream.info/api)
             enabled: Whether this collector should run
+            rpc_concurrency: Maximum API requests in flight at once
+                (default TX_FETCH_CONCURRENCY)
         """
         self.rpc_url = rpc_url
         self.enabled = enabled
+        self.rpc_concurrency = max(1, rpc_concurrency or self.TX_FETCH_CONCURRENCY)
         # Track last processed block to collect sequentially
         self.last_block_height = None
-        # Retry and backoff state for resilient API calls
-        self.retry_delay = 1  # Start with 1 second
-        self.max_retry_delay = 300  # Max 5 minutes
         self.last_successful_collect = None
         # Initialize data validator for quality checks
         self.validator = DataValidator()
+        # Shared HTTP session, created lazily on first collect() (see _get_session)
+        self._session: aiohttp.ClientSession | None = None
+        # Cached chain tip as (height, monotonic fetch time) - see _get_tip_height
+        self._tip_cache: tuple[int, float] | None = None
+        self._tip_ttl = 30.0
+        # ETag of the last tip-height response, sent back as If-None-Match
+        self._tip_etag: str | None = None
+        # Recently fetched confirmed transactions, keyed by txid
+        self._tx_cache: LRUCache = LRUCache(maxsize=self.TX_CACHE_SIZE)
+        # Data waiting to be written to ClickHouse, stored column-major: one list
+        # per column in _BLOCK_COLUMNS/_TX_COLUMNS order (see _maybe_flush)
+        self._block_buf: list[list] = [[] for _ in _BLOCK_COLUMNS]
+        self._tx_buf: list[list] = [[] for _ in _TX_COLUMNS]
+        self._last_flush = time.monotonic()
+        # One collection_metrics row per collect(), in _METRICS_COLUMNS order
+        self._metrics_buf: list[tuple] = []
+        self._last_metrics_flush = time.monotonic()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on first use.
+
+        EDUCATIONAL NOTE - Connection Reuse:
+        Opening a new ClientSession per poll means a fresh TCP + TLS handshake with
+        Blockstream every cycle. A single long-lived session keeps its connection
+        pool warm (HTTP keep-alive), so after the first request each call costs
+        roughly one network round trip instead of several.
 
-    async def _api_call_with_retry(self, session, url, max_retries=3, return_type='json'):
+        The connector also caches DNS lookups for 10 minutes and resolves names
+        asynchronously (aiodns) instead of in a thread pool, so a steady-state poll
+        costs neither a DNS query nor a handshake. aiohttp already sets TCP_NODELAY
+        on client sockets, so small requests are not held back by Nagle's algorithm.
+
+        The session is created lazily because aiohttp sessions must be created
+        inside a running event loop, which is not the case at import time.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=self.rpc_concurrency,
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                    resolver=aiohttp.AsyncResolver(),
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True
+                ),
+                timeout=_REQUEST_TIMEOUT
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session. Called by the scheduler on shutdown."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _api_call_with_retry(self, session, url, return_type='json',
+                                   extra_headers=None, with_etag=False):
         """
         Make API call with exponential backoff for rate limits and transient failures.
 
         EDUCATIONAL NOTE - Resilient API Calls:
         Public APIs can fail for many reasons: rate limits, network issues, temporary
         outages. Exponential backoff (1s, 2s, 4s, 8s...) prevents overwhelming the
-        server while allowing recovery from transient failures.
+        server while allowing recovery from transient failures. We add random
+        "jitter" to each delay so that many clients rate-limited at the same moment
+        don't all retry in lockstep (the "thundering herd" problem). When the server
+        says how long to wait via a Retry-After header, we honor it instead.
+
+        The retry policy itself lives in the @retry decorator on _do_get (tenacity).
 
         Args:
             session: aiohttp ClientSession
             url: Full URL to fetch
-            max_retries: Maximum number of retry attempts
             return_type: 'json' or 'text' for response parsing
+            extra_headers: Optional request headers (e.g. If-None-Match)
+            with_etag: Return a (body, etag) tuple instead of just the body
 
         Returns:
-            Parsed response (dict/list for JSON, str for text)
+            Parsed response (dict/list for JSON, str for text), or None on 404.
+            NOT_MODIFIED is returned as the body on HTTP 304.
 
         Raises:
-            Exception: After all retries exhausted
+            The last error (timeout, connection or HTTP error) after all retries are exhausted
         """
-        for attempt in range(max_retries):
-            try:
-                timeout = aiohttp.ClientTimeout(total=10)
-                async with session.get(url, timeout=timeout) as resp:
-                    # Check for rate limiting
-                    if resp.status == 429:
-                        retry_after = int(resp.headers.get('Retry-After', self.retry_delay))
-                        logger.warning(f"Rate limited by Blockstream API, waiting {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        self.retry_delay = min(self.retry_delay * 2, self.max_retry_delay)
-                        continue
+        return await self._do_get(session, url, return_type, extra_headers, with_etag)
+
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type(_TRANSIENT_EXC),
+        before_sleep=_log_retry,
+        reraise=True
+    )
+    async def _do_get(self, session, url, return_type, extra_headers=None, with_etag=False):
+        """Perform a single GET request; retried by the decorator on transient failures."""
+        # The 10s timeout is set once on the shared session (see _get_session)
+        async with session.get(url, headers=extra_headers) as resp:
+            # Conditional GET answered "unchanged" - there is no body to parse
+            if resp.status == 304:
+                return (NOT_MODIFIED, resp.headers.get('ETag')) if with_etag else NOT_MODIFIED
+
+            # Rate limited - let the retry policy wait as long as the server asks
+            if resp.status == 429:
+                raise RateLimited(_parse_retry_after(resp.headers.get('Retry-After')))
+
+            # Check for "block not found" (404) - not an error, just no new block yet
+            if resp.status == 404:
+                logger.info("Bitcoin block not found - waiting for next block to be mined")
+                return None
+
+            # Any other HTTP error raises aiohttp.ClientResponseError; it is a
+            # ClientError, so the retry policy treats it as transient and
+            # _log_retry reports it
+            resp.raise_for_status()
+
+            # Success - parse response. orjson parses the raw bytes directly, which
+            # is several times faster than aiohttp's resp.json() (stdlib json on a
+            # decoded str).
+            if return_type == 'json':
+                body = orjson.loads(await resp.read())
+            else:
+                body = await resp.text()
+            return (body, resp.headers.get('ETag')) if with_etag else body
+
+    def _maybe_flush(self, client, force=False):
+        """
+        Write buffered block and transaction rows to ClickHouse if a flush is due.
 
-                    # Check for "block not found" (404) - not an error, just no new block yet
-                    if resp.status == 404:
-                        logger.info("Bitcoin block not found - waiting for next block to be mined")
-                        return None
-
-                    # Check for other HTTP errors
-                    if resp.status >= 400:
-                        error_text = await resp.text()
-                        logger.warning(f"HTTP {resp.status} error on {url}: {error_text[:100]}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(2 ** attempt)
-                            continue
-                        else:
-                            raise Exception(f"HTTP {resp.status}: {error_text[:100]}")
-
-                    # Success - parse response
-                    if return_type == 'json':
-                        return await resp.json()
-                    else:
-                        return await resp.text()
-
-            except asyncio.TimeoutError:
-                logger.warning(f"Timeout on {url}, attempt {attempt + 1}/{max_retries}")
-                if attempt == max_retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)
-            except aiohttp.ClientError as e:
-                logger.warning(f"Connection error on {url}: {e}, attempt {attempt + 1}/{max_retries}")
-                if attempt == max_retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)
-
-        raise Exception(f"Failed to fetch {url} after {max_retries} attempts")
+        EDUCATIONAL NOTE - Batching Inserts:
+        Every ClickHouse INSERT creates a new data "part" on disk that background
+        merges must later combine. Writing 1 block row and ~25 transaction rows
+        per insert creates a flood of tiny parts. Buffering rows in memory and
+        inserting them together - ClickHouse recommends at least ~1,000 rows per
+        insert - amortizes that cost across the whole batch.
+
+        Args:
+            client: ClickHouse database client
+            force: Flush regardless of buffer size or age (used on shutdown)
+        """
+        # data_quality rows have their own buffer and thresholds
+        flush_quality_issues(client, force=force)
+
+        due = (
+            force
+            or len(self._tx_buf[0]) >= self.FLUSH_MAX_ROWS
+            or time.monotonic() - self._last_flush >= self.FLUSH_MAX_AGE_SECONDS
+        )
+        if not due:
+            return
+
+        # Blocks first so transactions never reference a block that isn't stored.
+        # Each buffer is only cleared once its insert succeeded, so a failed
+        # flush is retried on the next call instead of losing rows.
+        if self._block_buf[0]:
+            self._insert_columns(client, 'bitcoin_blocks', self._block_buf, _BLOCK_COLUMNS)
+            self._block_buf = [[] for _ in _BLOCK_COLUMNS]
+        if self._tx_buf[0]:
+            self._insert_columns(client, 'bitcoin_transactions', self._tx_buf, _TX_COLUMNS)
+            self._tx_buf = [[] for _ in _TX_COLUMNS]
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _buffer_rows(buf, rows):
+        """Append each row's values (in column order) to the matching per-column lists in buf."""
+        for row in rows:
+            for column, value in zip(buf, row):
+                column.append(value)
+
+    def _insert_columns(self, client, table, columns_data, columns):
+        """
+        Insert column-oriented data in chunks of at most INSERT_MAX_ROWS.
+
+        EDUCATIONAL NOTE - Column-Oriented Inserts:
+        ClickHouse stores each column separately. When given rows, clickhouse_connect
+        first transposes them into columns before sending. Handing it columns
+        directly (column_oriented=True) skips that transpose and its temporary objects.
+        """
+        for start in range(0, len(columns_data[0]), self.INSERT_MAX_ROWS):
+            end = start + self.INSERT_MAX_ROWS
+            client.insert(
+                table,
+                [column[start:end] for column in columns_data],
+                column_names=columns,
+                column_oriented=True
+            )
+
+    def _maybe_flush_metrics(self, client, force=False):
+        """
+        Write buffered collection_metrics rows if a flush is due.
+
+        Metrics are tiny (one row per collect()), so inserting them one at a time
+        would create one ClickHouse part per poll - the same small-insert problem
+        as above, just at a lower rate.
+        """
+        due = (
+            force
+            or len(self._metrics_buf) >= self.METRICS_FLUSH_MAX_ROWS
+            or time.monotonic() - self._last_metrics_flush >= self.METRICS_FLUSH_MAX_AGE_SECONDS
+        )
+        if not due:
+            return
+
+        if self._metrics_buf:
+            client.insert(
+                'collection_metrics',
+                self._metrics_buf,
+                column_names=_METRICS_COLUMNS,
+                settings=_ASYNC_INSERT_SETTINGS
+            )
+            self._metrics_buf = []
+        self._last_metrics_flush = time.monotonic()
+
+    def flush(self, client):
+        """Write all buffered rows to ClickHouse. Called by the scheduler on shutdown."""
+        self._maybe_flush(client, force=True)
+        self._maybe_flush_metrics(client, force=True)
+
+    async def _get_tip_height(self, session):
+        """
+        Return the current chain height, served from a short-lived cache.
+
+        EDUCATIONAL NOTE - Caching Slow-Changing Values:
+        Bitcoin produces a block roughly every 10 minutes, but we poll every few
+        seconds. Almost every /blocks/tip/height call would return the same number,
+        so we remember the answer for a short TTL and skip the request entirely.
+        The cache is invalidated after each collected block so catching up to a
+        newer tip is never delayed.
+
+        Returns:
+            The latest block height, or None if the API is temporarily unavailable
+        """
+        now = time.monotonic()
+        if self._tip_cache is not None:
+            height, fetched_at = self._tip_cache
+            if now - fetched_at < self._tip_ttl:
+                return height
+
+        # EDUCATIONAL NOTE - Conditional GET (ETag / If-None-Match):
+        # The server tags each response with an ETag. Sending it back asks "has this
+        # changed?" - if not, the server replies 304 Not Modified with an empty body,
+        # saving bandwidth and parsing work on every unchanged poll.
+        headers = None
+        if self._tip_etag and self._tip_cache is not None:
+            headers = {'If-None-Match': self._tip_etag}
+
+        result = await self._api_call_with_retry(
+            session, f"{self.rpc_url}/blocks/tip/height", return_type='text',
+            extra_headers=headers, with_etag=True
+        )
+        if result is None:
+            return None
+        body, etag = result
+        if body is NOT_MODIFIED:
+            height = self._tip_cache[0]
+        else:
+            height = int(body)
+            self._tip_etag = etag
+        self._tip_cache = (height, now)
+        return height
 
     async def collect(self, client):
         """
@@ -188,226 +506,279 @@ class BitcoinCollector:
             # concurrent API calls. This is important when collecting from multiple
             # blockchains simultaneously - we don't want to block while waiting for
             # one API response.
-            async with aiohttp.ClientSession() as session:
-                # Get the current blockchain height (number of blocks)
-                latest_height_str = await self._api_call_with_retry(
-                    session, f"{self.rpc_url}/blocks/tip/height", return_type='text'
+            #
+            # The session is reused across collect() calls so connections stay
+            # alive between polls instead of being re-established every cycle.
+            session = await self._get_session()
+            # Get the current blockchain height (number of blocks)
+            latest_height = await self._get_tip_height(session)
+            if latest_height is None:
+                return  # API temporarily unavailable
+
+            # If first run, start from latest block
+            if self.last_block_height is None:
+                self.last_block_height = latest_height - 1
+
+            # Only collect if there's a new block
+            if self.last_block_height < latest_height:
+                block_height = self.last_block_height + 1
+
+                # Bitcoin requires two API calls: first get hash, then get block
+                # This is because blocks are identified by hash, not height
+                block_hash = await self._api_call_with_retry(
+                    session, f"{self.rpc_url}/block-height/{block_height}", return_type='text'
                 )
-                if latest_height_str is None:
-                    return  # API temporarily unavailable
-                latest_height = int(latest_height_str)
-
-                # If first run, start from latest block
-                if self.last_block_height is None:
-                    self.last_block_height = latest_height - 1
-
-                # Only collect if there's a new block
-                if self.last_block_height < latest_height:
-                    block_height = self.last_block_height + 1
-
-                    # Bitcoin requires two API calls: first get hash, then get block
-                    # This is because blocks are identified by hash, not height
-                    block_hash = await self._api_call_with_retry(
-                        session, f"{self.rpc_url}/block-height/{block_height}", return_type='text'
+                if block_hash is None:
+                    return  # Block not found yet (404) - waiting for next block to be mined
+
+                # EDUCATIONAL NOTE - Fetching Transaction IDs:
+                # The Blockstream API's /block/{hash} endpoint returns block metadata only.
+                # To get transaction IDs, we need a separate API call to /block/{hash}/txids
+                # This returns an array of transaction hashes (txids) that we can then query.
+                #
+                # Both calls only need the block hash, so we issue them concurrently
+                # and save one round trip compared to awaiting them one after another.
+                block, all_tx_ids = await asyncio.gather(
+                    self._api_call_with_retry(
+                        session, f"{self.rpc_url}/block/{block_hash}", return_type='json'
+                    ),
+                    self._api_call_with_retry(
+                        session, f"{self.rpc_url}/block/{block_hash}/txids", return_type='json'
                     )
-                    if block_hash is None:
-                        return  # Block not found yet (404) - waiting for next block to be mined
+                )
+                if block is None:
+                    return  # Block not available
+                if all_tx_ids is None:
+                    return  # Transaction IDs not available
+
+                # Limit to 25 transactions for educational purposes (explained below)
+                tx_ids = all_tx_ids[:25]
+
+                # EDUCATIONAL NOTE - Bitcoin Block Structure:
+                #
+                # block_height: Number of blocks since genesis (block 0). Also called
+                #               "block number" in other chains.
+                #
+                # previous_block_hash: Links to parent block, creating the blockchain.
+                #                      Genesis block has this set to all zeros.
+                #
+                # merkle_root: Root hash of a Merkle tree containing all transaction hashes.
+                #              This allows efficient verification that a transaction is in
+                #              a block without downloading all transactions (Simplified
+                #              Payment Verification / SPV). Changing ANY transaction
+                #              changes the merkle root.
+                #
+                # difficulty: A measure of how hard it is to find a valid block hash.
+                #             Adjusts every 2016 blocks to maintain ~10 minute block times.
+                #
+                # nonce: A 32-bit number miners increment to find a valid block hash.
+                #        A valid hash must be less than the target (derived from difficulty).
+                #        This is the "work" in Proof-of-Work: trial and error until valid.
+                #
+                # size: Block size in bytes. Bitcoin has a ~1MB base block size limit.
+                #
+                # weight: Replaced "size" as the limiting factor after SegWit upgrade.
+                #         Maximum weight is 4,000,000 units (allows ~1-4 MB of data).
+                #         SegWit transactions have lower weight, incentivizing adoption.
+                #
+                # BitcoinBlockRow's fields are in bitcoin_blocks column order, so the
+                # row can be buffered for insert as-is without a dict in between.
+                # Kept as the API's epoch int (shared by all txs): the validator
+                # and the DateTime columns both take it without a datetime in between
+                block_ts = block['timestamp']
+                block_row = BitcoinBlockRow(
+                    block_height=block_height,
+                    block_hash=block['id'],
+                    timestamp=block_ts,
+                    previous_block_hash=block['previousblockhash'],
+                    merkle_root=block['merkle_root'],
+                    difficulty=int(block['difficulty']),
+                    nonce=block['nonce'],
+                    size=block['size'],
+                    weight=block['weight'],
+                    transaction_count=block['tx_count']
+                )
 
-                    block = await self._api_call_with_retry(
-                        session, f"{self.rpc_url}/block/{block_hash}", return_type='json'
+                # ================================================================
+                # [VERACITY] Validate block data before insertion
+                # ================================================================
+                # This is a critical step in ensuring data quality. We check:
+                # - All required fields are present
+                # - Values are within expected ranges
+                # - Timestamp is reasonable
+                # - Hash formats are valid
+                block_validation = self.validator.validate_bitcoin_block(block_row._asdict())
+
+                if not block_validation.is_valid:
+                    logger.warning(
+                        f"[VERACITY] Bitcoin block {block_height} has quality issues: "
+                        f"{block_validation.issues}"
                     )
-                    if block is None:
-                        return  # Block not available
-
-                    # EDUCATIONAL NOTE - Fetching Transaction IDs:
-                    # The Blockstream API's /block/{hash} endpoint returns block metadata only.
-                    # To get transaction IDs, we need a separate API call to /block/{hash}/txids
-                    # This returns an array of transaction hashes (txids) that we can then query.
-                    all_tx_ids = await self._api_call_with_retry(
-                        session, f"{self.rpc_url}/block/{block_hash}/txids", return_type='json'
+                    # Log quality issue for tracking and analysis
+                    log_quality_issue(
+                        source='bitcoin',
+                        record_type='block',
+                        record_id=str(block_height),
+                        result=block_validation,
+                        client=client
                     )
-                    if all_tx_ids is None:
-                        return  # Transaction IDs not available
-
-                    # Limit to 25 transactions for educational purposes (explained below)
-                    tx_ids = all_tx_ids[:25]
-
-                    # EDUCATIONAL NOTE - Bitcoin Block Structure:
-                    #
-                    # block_height: Number of blocks since genesis (block 0). Also called
-                    #               "block number" in other chains.
-                    #
-                    # previous_block_hash: Links to parent block, creating the blockchain.
-                    #                      Genesis block has this set to all zeros.
-                    #
-                    # merkle_root: Root hash of a Merkle tree containing all transaction hashes.
-                    #              This allows efficient verification that a transaction is in
-                    #              a block without downloading all transactions (Simplified
-                    #              Payment Verification / SPV). Changing ANY transaction
-                    #              changes the merkle root.
-                    #
-                    # difficulty: A measure of how hard it is to find a valid block hash.
-                    #             Adjusts every 2016 blocks to maintain ~10 minute block times.
-                    #
-                    # nonce: A 32-bit number miners increment to find a valid block hash.
-                    #        A valid hash must be less than the target (derived from difficulty).
-                    #        This is the "work" in Proof-of-Work: trial and error until valid.
-                    #
-                    # size: Block size in bytes. Bitcoin has a ~1MB base block size limit.
-                    #
-                    # weight: Replaced "size" as the limiting factor after SegWit upgrade.
-                    #         Maximum weight is 4,000,000 units (allows ~1-4 MB of data).
-                    #         SegWit transactions have lower weight, incentivizing adoption.
-                    block_data = {
-                        'block_height': block_height,
-                        'block_hash': block['id'],
-                        'timestamp': datetime.fromtimestamp(block['timestamp']),
-                        'previous_block_hash': block['previousblockhash'],
-                        'merkle_root': block['merkle_root'],
-                        'difficulty': int(block['difficulty']),
-                        'nonce': block['nonce'],
-                        'size': block['size'],
-                        'weight': block['weight'],
-                        'transaction_count': block['tx_count']
-                    }
-
-                    # ================================================================
-                    # [VERACITY] Validate block data before insertion
-                    # ================================================================
-                    # This is a critical step in ensuring data quality. We check:
-                    # - All required fields are present
-                    # - Values are within expected ranges
-                    # - Timestamp is reasonable
-                    # - Hash formats are valid
-                    block_validation = self.validator.validate_bitcoin_block(block_data)
-
-                    if not block_validation.is_valid:
-                        logger.warning(
-                            f"[VERACITY] Bitcoin block {block_height} has quality issues: "
-                            f"{block_validation.issues}"
-                        )
-                        # Log quality issue for tracking and analysis
-                        log_quality_issue(
-                            source='bitcoin',
-                            record_type='block',
-                            record_id=str(block_height),
-                            result=block_validation,
-                            client=client
-                        )
 
-                    if block_validation.warnings:
-                        logger.info(
-                            f"[VERACITY] Bitcoin block {block_height} warnings: "
-                            f"{block_validation.warnings}"
+                if block_validation.warnings:
+                    logger.info(
+                        f"[VERACITY] Bitcoin block {block_height} warnings: "
+                        f"{block_validation.warnings}"
+                    )
+
+                # EDUCATIONAL NOTE - API Rate Limiting:
+                # We limit to 25 transactions per block for several reasons:
+                # 1. API Rate Limits: Public APIs have request quotas
+                # 2. Educational Focus: 25 transactions provide sufficient data for learning
+                # 3. Performance: Bitcoin blocks can have 2000+ transactions
+                # 4. Cost: Some APIs charge per request
+                #
+                # In production systems, you would:
+                # - Use pagination to fetch all transactions
+                # - Implement exponential backoff for rate limit errors
+                # - Consider running your own Bitcoin node for unlimited access
+
+                # tx_ids already fetched above from /block/{hash}/txids endpoint
+                tx_data = []
+
+                # EDUCATIONAL NOTE - Concurrent Fan-Out with a Semaphore:
+                # Each transaction is a separate API call. Awaiting them one by one
+                # costs 25 sequential round trips; asyncio.gather() sends them all at
+                # once and waits for the slowest. The semaphore caps how many are in
+                # flight so we stay polite to Blockstream's per-host rate limits
+                # (it matches the connector's limit_per_host).
+                sem = asyncio.Semaphore(self.rpc_concurrency)
+
+                # A confirmed transaction never changes, so the same txid showing up
+                # again (after a reorg or a restart near the tip) is served from a
+                # small LRU cache instead of another API call.
+                async def fetch_one(tx_id):
+                    tx = self._tx_cache.get(tx_id)
+                    if tx is not None:
+                        return tx
+                    async with sem:
+                        tx = await self._api_call_with_retry(
+                            session, f"{self.rpc_url}/tx/{tx_id}", return_type='json'
                         )
+                    if tx is not None and tx.get('status', {}).get('confirmed'):
+                        self._tx_cache[tx_id] = tx
+                    return tx
 
-                    # Convert dict to list for clickhouse_connect (required when table has DEFAULT columns)
-                    columns = ['block_height', 'block_hash', 'timestamp', 'previous_block_hash',
-                             'merkle_root', 'difficulty', 'nonce', 'size', 'weight', 'transaction_count']
-                    block_values = [[block_data[col] for col in columns]]
-                    client.insert('bitcoin_blocks', block_values, column_names=columns)
-                    records_collected += 1
-
-                    # EDUCATIONAL NOTE - API Rate Limiting:
-                    # We limit to 25 transactions per block for several reasons:
-                    # 1. API Rate Limits: Public APIs have request quotas
-                    # 2. Educational Focus: 25 transactions provide sufficient data for learning
-                    # 3. Performance: Bitcoin blocks can have 2000+ transactions
-                    # 4. Cost: Some APIs charge per request
-                    #
-                    # In production systems, you would:
-                    # - Use pagination to fetch all transactions
-                    # - Implement exponential backoff for rate limit errors
-                    # - Consider running your own Bitcoin node for unlimited access
-
-                    # tx_ids already fetched above from /block/{hash}/txids endpoint
-                    tx_data = []
-
-                    for tx_id in tx_ids:
-                        try:
-                            tx = await self._api_call_with_retry(
-                                session, f"{self.rpc_url}/tx/{tx_id}", return_type='json'
-                            )
-                            if tx is None:
-                                logger.warning(f"Could not fetch Bitcoin tx {tx_id}")
-                                continue
-
-                            # EDUCATIONAL NOTE - Bitcoin Transaction Structure (UTXO Model):
-                            #
-                            # Unlike Ethereum, Bitcoin transactions don't have a simple
-                            # "from" address field. The sender is determined by which
-                            # UTXOs (inputs) are being spent.
-                            #
-                            # vin (inputs): List of UTXOs being consumed (spent)
-                            #               Each input references a previous transaction output
-                            #
-                            # vout (outputs): List of new UTXOs being created
-                            #                 Each output has an amount and locking script
-                            #
-                            # input_count: Number of UTXOs being spent in this transaction
-                            # output_count: Number of new UTXOs being created
-                            #
-                            # fee: Satoshis paid to miners = sum(input values) - sum(output values)
-                            #      Higher fees = faster confirmation (miners prioritize profitable txs)
-                            #      Fee is implicit, not a separate field in the transaction
-                            #
-                            # size: Transaction size in bytes (affects fee calculation)
-                            # weight: SegWit-adjusted size for fee calculation
-                            #
-                            # Bitcoin's smallest unit: 1 Satoshi = 0.00000001 BTC (8 decimal places)
-                            tx_record = {
-                                'tx_hash': tx['txid'],
-                                'block_height': block_height,
-                                'block_hash': block['id'],
-                                'size': tx['size'],
-                                'weight': tx['weight'],
-                                'fee': int(tx.get('fee', 0)),  # Fee in satoshis, convert to int for UInt64
-                                'input_count': len(tx['vin']),
-                                'output_count': len(tx['vout']),
-                                'timestamp': datetime.fromtimestamp(block['timestamp'])
-                            }
-
-                            # [VERACITY] Validate transaction before adding to batch
-                            tx_validation = self.validator.validate_bitcoin_transaction(tx_record)
-                            if not tx_validation.is_valid:
-                                logger.debug(
-                                    f"[VERACITY] Bitcoin tx {tx['txid'][:16]}... has issues: "
-                                    f"{tx_validation.issues}"
-                                )
-
-                            tx_data.append(tx_record)
-                        except Exception as e:
-                            # Log but continue - don't let one bad transaction stop collection
-                            logger.warning(f"Error collecting Bitcoin tx {tx_id}: {e}")
+                # gather() preserves input order, so results line up with tx_ids
+                results = await asyncio.gather(
+                    *(fetch_one(tx_id) for tx_id in tx_ids), return_exceptions=True
+                )
+
+                for tx_id, tx in zip(tx_ids, results):
+                    if isinstance(tx, Exception):
+                        # Log but continue - don't let one bad transaction stop collection
+                        logger.warning(f"Error collecting Bitcoin tx {tx_id}: {tx}")
+                        continue
+                    try:
+                        if tx is None:
+                            logger.warning(f"Could not fetch Bitcoin tx {tx_id}")
                             continue
 
-                    if tx_data:
-                        # Convert list of dicts to list of lists for clickhouse_connect
-                        # (required when table has DEFAULT columns)
-                        columns = ['tx_hash', 'block_height', 'block_hash', 'size',
-                                 'weight', 'fee', 'input_count', 'output_count', 'timestamp']
-                        tx_values = [[tx[col] for col in columns] for tx in tx_data]
-                        client.insert('bitcoin_transactions', tx_values, column_names=columns)
-                        records_collected += len(tx_data)
-
-                    self.last_block_height = block_height
-                    self.last_successful_collect = datetime.now()
-                    # Reduce retry delay on successful collection
-                    self.retry_delay = max(1, self.retry_delay // 2)
-                    logger.info(f"Collected Bitcoin block {block_height} with {len(tx_data)} transactions")
+                        # EDUCATIONAL NOTE - Bitcoin Transaction Structure (UTXO Model):
+                        #
+                        # Unlike Ethereum, Bitcoin transactions don't have a simple
+                        # "from" address field. The sender is determined by which
+                        # UTXOs (inputs) are being spent.
+                        #
+                        # vin (inputs): List of UTXOs being consumed (spent)
+                        #               Each input references a previous transaction output
+                        #
+                        # vout (outputs): List of new UTXOs being created
+                        #                 Each output has an amount and locking script
+                        #
+                        # input_count: Number of UTXOs being spent in this transaction
+                        # output_count: Number of new UTXOs being created
+                        #
+                        # fee: Satoshis paid to miners = sum(input values) - sum(output values)
+                        #      Higher fees = faster confirmation (miners prioritize profitable txs)
+                        #      Fee is implicit, not a separate field in the transaction
+                        #
+                        # size: Transaction size in bytes (affects fee calculation)
+                        # weight: SegWit-adjusted size for fee calculation
+                        #
+                        # Bitcoin's smallest unit: 1 Satoshi = 0.00000001 BTC (8 decimal places)
+                        tx_record = {
+                            'tx_hash': tx['txid'],
+                            'block_height': block_height,
+                            'block_hash': block['id'],
+                            'size': tx['size'],
+                            'weight': tx['weight'],
+                            'fee': int(tx.get('fee', 0)),  # Fee in satoshis, convert to int for UInt64
+                            'input_count': len(tx['vin']),
+                            'output_count': len(tx['vout']),
+                            'timestamp': block_ts
+                        }
+
+                        tx_data.append(tx_record)
+                    except Exception as e:
+                        # Log but continue - don't let one bad transaction stop collection
+                        logger.warning(f"Error collecting Bitcoin tx {tx_id}: {e}")
+                        continue
+
+                if tx_data:
+                    # [VERACITY] Validate all transactions of the block in one batch
+                    # call and only log the ones that failed
+                    tx_validations = self.validator.validate_bitcoin_transactions_batch(tx_data)
+                    for tx_record, tx_validation in zip(tx_data, tx_validations):
+                        if not tx_validation.is_valid:
+                            logger.debug(
+                                f"[VERACITY] Bitcoin tx {tx_record['tx_hash'][:16]}... has issues: "
+                                f"{tx_validation.issues}"
+                            )
+
+                # Buffer the block's values column by column; _maybe_flush() writes
+                # them together with other pending rows. The block and its
+                # transactions are buffered together with last_block_height,
+                # with no await in between: a collect() that fails or is
+                # cancelled (see the collector timeout in main.py) part way
+                # through a block leaves nothing behind, and the block is
+                # fetched again next cycle instead of being stored twice.
+                self._buffer_rows(self._block_buf, (block_row,))
+                records_collected += 1
+                if tx_data:
+                    self._buffer_rows(self._tx_buf, map(_TX_GETTER, tx_data))
+                    records_collected += len(tx_data)
+
+                self.last_block_height = block_height
+                self.last_successful_collect = datetime.now()
+                # Force a fresh tip lookup next cycle in case we are catching up.
+                # The height itself is kept so a 304 reply can reuse it.
+                if self._tip_cache is not None:
+                    self._tip_cache = (self._tip_cache[0], float('-inf'))
+                logger.info(f"Collected Bitcoin block {block_height} with {len(tx_data)} transactions")
 
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Error collecting Bitcoin data: {e}")
 
         finally:
+            # Write buffered rows if a flush is due
+            try:
+                self._maybe_flush(client)
+            except Exception as e:
+                error_msg = error_msg or str(e)
+                logger.error(f"Error flushing Bitcoin data: {e}")
+
             # Record collection metrics for monitoring and analysis
+            # (buffered like block data; see _maybe_flush_metrics)
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-            client.insert('collection_metrics', [{
-                'metric_time': start_time,
-                'source': 'bitcoin',
-                'records_collected': records_collected,
-                'collection_duration_ms': duration_ms,
-                'error_count': 1 if error_msg else 0,
-                'error_message': error_msg
-            }])
+            self._metrics_buf.append((
+                start_time,
+                'bitcoin',
+                records_collected,
+                duration_ms,
+                1 if error_msg else 0,
+                error_msg
+            ))
+            try:
+                self._maybe_flush_metrics(client)
+            except Exception as e:
+                logger.error(f"Error writing Bitcoin collection metrics: {e}")
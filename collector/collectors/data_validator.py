@@ -31,14 +31,628 @@ Quality Dimensions Measured:
 └────────────────┴────────────────────────────────────────────────────────────┘
 """
 
+import atexit
+import linecache
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+import os
+import queue
+import re
+import string
+import textwrap
+import threading
+import time
+import uuid
+from array import array
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+
 logger = logging.getLogger(__name__)
 
+# Matcher for 64-character hex strings (SHA-256 block hashes and txids),
+# compiled once at import.
+#
+# EDUCATIONAL NOTE - Format Checks Without Parsing:
+# int(hash_str, 16) would also reject non-hex input, but it builds a 256-bit
+# Python integer just to throw it away. A fixed-length character class regex
+# scans the string in C and allocates nothing.
+_HEX64_MATCH = re.compile(r'\A[0-9a-fA-F]{64}\Z').match
+
+# Solana transaction signature: 64 bytes in base58 (87-88 characters).
+# Base58 is alphanumeric without 0, O, I and l; the 80-90 length range keeps
+# the tolerance of the length check this replaces.
+_BASE58_SIGNATURE = re.compile(r'\A[1-9A-HJ-NP-Za-km-z]{80,90}\Z').match
+
+
+def _hex64_mask(values: Sequence[Any]) -> np.ndarray:
+    """
+    Vectorized _HEX64_MATCH for a whole batch of values.
+
+    EDUCATIONAL NOTE - SWAR-Style Byte Classification:
+    Instead of matching one string at a time, all candidate hashes are packed
+    into a single (n, 64) uint8 matrix and every byte is classified at once.
+    Each class test is a single unsigned compare: subtracting '0' makes the
+    digits 0-9 and wraps everything below '0' around to large values, so
+    "is a digit" becomes (byte - 0x30) < 10. Clearing bit 0x20 folds
+    lower-case letters onto upper-case, so "is a-f/A-F" becomes
+    ((byte & 0xDF) - 0x41) < 6. A row is valid when all 64 bytes pass.
+    """
+    n = len(values)
+    ok = np.fromiter((isinstance(v, str) and len(v) == 64 for v in values), dtype=bool, count=n)
+    if not ok.any():
+        return ok
+
+    # 'replace' keeps one byte per character, and '?' is never hex
+    packed = ''.join([v for v, good in zip(values, ok) if good]).encode('ascii', 'replace')
+    b = np.frombuffer(packed, dtype=np.uint8).reshape(-1, 64)
+    is_digit = (b - 0x30) < 10
+    is_alpha = ((b & 0xDF) - 0x41) < 6
+    ok[ok] = (is_digit | is_alpha).all(axis=1)
+    return ok
+
+
+def _column(values: Tuple[Any, ...], default: float, dtype=np.int64) -> np.ndarray:
+    """
+    Convert one field's values (one per record) into a NumPy column.
+
+    Missing or None values take the field's default; they are reported
+    separately by the completeness check.
+    """
+    return np.fromiter(
+        (v if v is not None else default for v in values),
+        dtype=dtype, count=len(values)
+    )
+
+
+class Issue(NamedTuple):
+    """
+    One validation issue or warning, formatted only when it is read.
+
+    EDUCATIONAL NOTE - Lazy Message Formatting:
+    Most validation messages are never read one by one - they are counted,
+    or joined once when a record is logged to the data_quality table. So a
+    validator records just a message code and its values, and the text is
+    produced by str() on demand from the _FMT template table. The hot path
+    then builds a small tuple instead of formatting a string per message.
+    """
+    code: str
+    args: Tuple[Any, ...]
+
+    def __str__(self) -> str:
+        return _FMT[self.code].format(*self.args)
+
+    # Lists of issues print like the plain message lists they replace
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+# Message templates by Issue code, filled in from the schemas below
+_FMT: Dict[str, str] = {}
+
+# Shared stand-in for "no issues" / "no warnings". Most records pass, so
+# results only get a real list once the first message is added (see _add).
+_EMPTY: Tuple[Issue, ...] = ()
+
+
+def _add(messages: Optional[List[Issue]], msg: Issue) -> List[Issue]:
+    """Append msg, creating the list on first use (None means nothing recorded yet)."""
+    if messages is None:
+        return [msg]
+    messages.append(msg)
+    return messages
+
+
+_YEAR_S = 365 * 24 * 3600
+
+
+def _normalize_timestamp(value: Any) -> int:
+    """
+    Convert a record timestamp to int epoch seconds.
+
+    EDUCATIONAL NOTE - Epoch Integers vs datetime Objects:
+    The APIs deliver block times as Unix epoch integers. Keeping them as
+    ints makes every temporal check a plain integer comparison, where a
+    datetime is a ~48 byte object whose comparisons and subtractions go
+    through Python-level rich compare and timedelta objects. ClickHouse
+    DateTime columns accept epoch ints directly, so nothing needs a
+    datetime until it is shown to a person. Callers that still pass
+    datetime objects are converted here.
+    """
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return int(value)
+
+
+def _reference_ts(now: Any = None) -> int:
+    """Epoch seconds to validate timestamps against (now, or the current time)."""
+    return int(time.time()) if now is None else _normalize_timestamp(now)
+
+# Slots of DataValidator._counts
+_IDX_TOTAL = 0
+_IDX_PASSED = 1
+_IDX_FAILED = 2
+_IDX_WARNINGS = 3
+
+# More issues than this make a record INVALID (see _QL_TABLE); unless
+# DataValidator(collect_all_issues=True), validation stops at that point
+_INVALID_ISSUE_COUNT = 2
+
+
+# === DECLARATIVE VALIDATION SCHEMAS ===
+#
+# Each record type is described once, as data. The validator functions that
+# actually run are generated from these descriptions (see "CODE GENERATION"
+# below), so the schema is the single source of truth for every path: the
+# single-record validator and the NumPy batch validator.
+
+ISSUE = 'issue'
+WARNING = 'warning'
+
+
+class _Field(NamedTuple):
+    """A required record field. default/dtype are set for numeric fields only."""
+    name: str
+    default: Optional[float] = None     # Stand-in when missing; None = not numeric
+    dtype: Any = np.int64               # NumPy column type for the batch path
+
+
+class _Rule(NamedTuple):
+    """
+    One numeric range check.
+
+    expr is evaluated both on plain Python numbers (single record) and on
+    NumPy columns (batch), so it may only use comparisons, arithmetic and
+    the & / | operators - never and / or / not. Upper-case names are
+    DataValidator class constants and are inlined into the generated code.
+    message is a str.format-style template over the same names; code is the
+    Issue code it is registered under.
+    """
+    code: str
+    expr: str
+    severity: str
+    message: str
+
+
+class _Schema(NamedTuple):
+    """Everything the code generator needs to know about one record type."""
+    name: str
+    fields: Tuple[_Field, ...]
+    missing_label: str
+    rules: Tuple[_Rule, ...]
+    # (name, expr) values computed from numeric fields, usable in rules/metrics
+    derived: Tuple[Tuple[str, str], ...] = ()
+    # (metric key, field or derived name) copied into ValidationResult.metrics
+    metrics: Tuple[Tuple[str, str], ...] = ()
+    # Hand-written checks that are not numeric ranges (timestamps, formats).
+    # HEX64(x) is expanded to the regex check (single record) or a lookup in
+    # a precomputed _hex64_mask column (batch).
+    tail: str = ''
+    # (Issue code, positional template) for the messages the tail records
+    messages: Tuple[Tuple[str, str], ...] = ()
+    # Whether results feed the pass/fail counters
+    counted: bool = False
+    # Whether a batch validator is generated (only for record types that a
+    # collector validates many at a time)
+    batch: bool = False
+
+
+_BTC_BLOCK_SCHEMA = _Schema(
+    name='btc_block',
+    fields=(
+        _Field('block_height', -1), _Field('block_hash'), _Field('timestamp'),
+        _Field('previous_block_hash'), _Field('merkle_root'),
+        # Difficulty is a float in the API response and can exceed 1e14
+        _Field('difficulty', 0, np.float64), _Field('nonce'),
+        _Field('size', 0), _Field('weight', 0), _Field('transaction_count', 0),
+    ),
+    missing_label='Missing required fields',
+    rules=(
+        # Block height must be non-negative
+        _Rule('BTC_HEIGHT_INVALID', 'block_height < 0', ISSUE,
+              'Invalid block_height: {block_height}'),
+        # Size and weight must be positive and within limits
+        _Rule('BTC_SIZE_INVALID', 'size <= 0', ISSUE, 'Invalid block size: {size}'),
+        _Rule('BTC_SIZE_LARGE', 'size > BITCOIN_BLOCK_SIZE_MAX', WARNING,
+              'Unusually large block size: {size} bytes'),
+        _Rule('BTC_WEIGHT_INVALID', 'weight <= 0', ISSUE, 'Invalid block weight: {weight}'),
+        _Rule('BTC_WEIGHT_LARGE', 'weight > BITCOIN_BLOCK_SIZE_MAX', WARNING,
+              'Block weight exceeds expected max: {weight}'),
+        # Difficulty must be positive
+        _Rule('BTC_DIFFICULTY_INVALID', 'difficulty < BITCOIN_DIFFICULTY_MIN', ISSUE,
+              'Invalid difficulty: {difficulty}'),
+        # Transaction count sanity check
+        _Rule('BTC_NO_TXS', 'transaction_count < 1', WARNING,
+              'Block has no transactions (coinbase missing?): {transaction_count}'),
+        _Rule('BTC_MANY_TXS', 'transaction_count > BITCOIN_TX_PER_BLOCK_MAX', WARNING,
+              'Unusually high transaction count: {transaction_count}'),
+    ),
+    metrics=(('tx_count', 'transaction_count'),),
+    tail='''
+        # === TEMPORAL VALIDITY ===
+        if timestamp:
+            ts = timestamp if timestamp.__class__ is int else _normalize_timestamp(timestamp)
+            age_s = now_ts - ts
+            if ts > now_ts + BITCOIN_TIMESTAMP_TOLERANCE_HOURS * 3600:
+                issues = _add(issues, _Issue('BTC_TIMESTAMP_FUTURE', (ts,)))
+            elif age_s > _YEAR_S:  # More than a year old
+                warnings = _add(warnings, _Issue('BTC_TIMESTAMP_OLD', (ts,)))
+            metrics['timestamp_age_hours'] = abs(age_s) * (1 / 3600)
+        else:
+            issues = _add(issues, _Issue('BTC_TIMESTAMP_MISSING', ()))
+
+        # === HASH FORMAT VALIDATION ===
+        # Bitcoin hashes are 64 hex characters (256 bits)
+        if not HEX64(block_hash):
+            issues = _add(issues, _Issue('BTC_HASH_INVALID', (block_hash or '',)))
+        if not HEX64(merkle_root):
+            warnings = _add(warnings, _Issue('BTC_MERKLE_INVALID', ()))
+    ''',
+    messages=(
+        ('BTC_TIMESTAMP_FUTURE', 'Block timestamp is in the future: {0} (epoch s)'),
+        ('BTC_TIMESTAMP_OLD', 'Block is very old: {0} (epoch s)'),
+        ('BTC_TIMESTAMP_MISSING', 'Missing timestamp'),
+        ('BTC_HASH_INVALID', 'Invalid block_hash format: {0:.20}...'),
+        ('BTC_MERKLE_INVALID', 'Invalid merkle_root format'),
+    ),
+    counted=True,
+)
+
+_BTC_TX_SCHEMA = _Schema(
+    name='btc_tx',
+    fields=(
+        _Field('tx_hash'), _Field('block_height'), _Field('fee', -1),
+        _Field('input_count', 0), _Field('output_count', 0),
+    ),
+    missing_label='Missing fields',
+    rules=(
+        # Fee validation (can be 0 for coinbase transaction)
+        _Rule('BTC_FEE_NEGATIVE', 'fee < 0', ISSUE, 'Negative fee: {fee}'),
+        _Rule('BTC_FEE_ZERO', 'fee == 0', WARNING, 'Zero fee (coinbase transaction?)'),
+        # Coinbase transaction has no inputs
+        _Rule('BTC_COINBASE', '(input_count == 0) & (output_count > 0)', WARNING,
+              'No inputs (coinbase transaction)'),
+        # Negative counts, unless the record already looks like a coinbase
+        _Rule('BTC_COUNTS_INVALID',
+              '((input_count < 0) | (output_count < 0)) & ((input_count != 0) | (output_count <= 0))',
+              ISSUE, 'Invalid input/output counts: {input_count}/{output_count}'),
+        _Rule('BTC_NO_OUTPUTS', 'output_count == 0', ISSUE, 'Transaction has no outputs'),
+    ),
+    tail='''
+        # Hash format
+        if not HEX64(tx_hash):
+            issues = _add(issues, _Issue('BTC_TX_HASH_INVALID', ()))
+    ''',
+    messages=(('BTC_TX_HASH_INVALID', 'Invalid tx_hash format'),),
+    batch=True,
+)
+
+_SOL_BLOCK_SCHEMA = _Schema(
+    name='sol_block',
+    fields=(
+        _Field('slot', 0), _Field('block_height', 0), _Field('block_hash'),
+        _Field('timestamp'), _Field('parent_slot', 0), _Field('transaction_count', 0),
+    ),
+    missing_label='Missing fields',
+    # Skipped slots indicate network health
+    derived=(('skipped_slots', 'slot - parent_slot - 1'),),
+    rules=(
+        # Slot/height consistency
+        _Rule('SOL_HEIGHT_AHEAD', 'block_height > slot', ISSUE,
+              'block_height ({block_height}) > slot ({slot})'),
+        _Rule('SOL_PARENT_AHEAD', 'parent_slot >= slot', ISSUE,
+              'parent_slot ({parent_slot}) >= slot ({slot})'),
+        _Rule('SOL_MANY_SKIPPED', 'skipped_slots > 10', WARNING,
+              'Many skipped slots: {skipped_slots}'),
+        # Transaction count
+        _Rule('SOL_TX_COUNT_NEGATIVE', 'transaction_count < 0', ISSUE,
+              'Negative transaction count: {transaction_count}'),
+        _Rule('SOL_TX_COUNT_HIGH', 'transaction_count > SOLANA_TX_PER_BLOCK_MAX', WARNING,
+              'Very high transaction count: {transaction_count}'),
+    ),
+    metrics=(('skipped_slots', 'skipped_slots'), ('tx_count', 'transaction_count')),
+    tail='''
+        # Timestamp validation
+        if timestamp:
+            ts = timestamp if timestamp.__class__ is int else _normalize_timestamp(timestamp)
+            if ts > now_ts + SOLANA_TIMESTAMP_TOLERANCE_SECONDS:
+                issues = _add(issues, _Issue('SOL_TIMESTAMP_FUTURE', (ts,)))
+            metrics['timestamp_age_seconds'] = now_ts - ts
+    ''',
+    messages=(('SOL_TIMESTAMP_FUTURE', 'Timestamp in future: {0} (epoch s)'),),
+)
+
+_SOL_TX_SCHEMA = _Schema(
+    name='sol_tx',
+    fields=(_Field('signature'), _Field('slot'), _Field('fee', -1), _Field('status')),
+    missing_label='Missing fields',
+    rules=(
+        _Rule('SOL_FEE_NEGATIVE', 'fee < 0', ISSUE, 'Negative fee: {fee}'),
+        _Rule('SOL_FEE_LOW', '(fee > 0) & (fee < SOLANA_FEE_MIN_LAMPORTS)', WARNING,
+              'Fee below expected minimum: {fee} lamports'),
+    ),
+    tail='''
+        # Status validation
+        status = status or ''
+        if status not in ('success', 'failed'):
+            issues = _add(issues, _Issue('SOL_STATUS_INVALID', (status,)))
+        metrics['is_failed'] = 1.0 if status == 'failed' else 0.0
+
+        # Signature format (should be base58, typically 87-88 characters):
+        # charset and length in one regex call, details only on failure
+        if not (signature and _base58_signature(signature)):
+            signature_length = len(signature or '')
+            if signature_length < 80 or signature_length > 90:
+                warnings = _add(warnings, _Issue('SOL_SIGNATURE_LENGTH', (signature_length,)))
+            else:
+                warnings = _add(warnings, _Issue('SOL_SIGNATURE_FORMAT', ()))
+    ''',
+    messages=(
+        ('SOL_STATUS_INVALID', 'Invalid status: {0}'),
+        ('SOL_SIGNATURE_LENGTH', 'Unusual signature length: {0}'),
+        ('SOL_SIGNATURE_FORMAT', 'Signature is not base58'),
+    ),
+)
+
+_SCHEMAS = (_BTC_BLOCK_SCHEMA, _BTC_TX_SCHEMA, _SOL_BLOCK_SCHEMA, _SOL_TX_SCHEMA)
+
+
+def _missing_code(schema: _Schema) -> str:
+    """Issue code of a schema's completeness message, e.g. BTC_BLOCK_MISSING."""
+    return f"{schema.name.upper()}_MISSING"
+
+
+def _positional(template: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Split a named message template into a positional one and its argument names.
+
+    'Invalid input/output counts: {input_count}/{output_count}' becomes
+    ('Invalid input/output counts: {0}/{1}', ('input_count', 'output_count')).
+    """
+    names: List[str] = []
+    parts = []
+    for literal, name, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if name is not None:
+            if name not in names:
+                names.append(name)
+            parts.append('{%d%s%s}' % (names.index(name),
+                                        f"!{conversion}" if conversion else '',
+                                        f":{spec}" if spec else ''))
+    return ''.join(parts), tuple(names)
+
+
+for _schema in _SCHEMAS:
+    _FMT[_missing_code(_schema)] = _schema.missing_label + ': {0}'
+    _FMT.update((rule.code, _positional(rule.message)[0]) for rule in _schema.rules)
+    _FMT.update(_schema.messages)
+del _schema
+
+
+# === CODE GENERATION ===
+#
+# EDUCATIONAL NOTE - Specializing Code for a Fixed Schema:
+# A generic validator walks its rule table for every record: look up the
+# field, look up the threshold, pick the comparison, format the message.
+# Since the schema never changes at runtime, we instead write out a Python
+# function with every field read, threshold and message spelled out, and
+# compile it once with exec() - the same technique dataclasses and
+# namedtuple use. CPython then runs straight-line code with constants
+# already folded in instead of interpreting the table record by record.
+
+_IDENT_RE = re.compile(r'\b[A-Za-z_]\w*\b')
+_HEX64_TOKEN_RE = re.compile(r'HEX64\((\w+)\)')
+
+
+class _CompiledSchema(NamedTuple):
+    """Generated validators for one schema."""
+    single: Callable    # (record, now_ts) -> (issues, warnings, metrics)
+    batch: Optional[Callable]   # (records, now_ts) -> [(issues, warnings, metrics), ...]
+    source: str         # Generated Python source, for debugging
+
+
+def _inline(expr: str, constants: Dict[str, float], rename: Optional[Callable] = None) -> str:
+    """Replace constant names by their values (and optionally rename other identifiers)."""
+    def sub(m):
+        name = m.group()
+        if name in constants:
+            return repr(constants[name])
+        return rename(name) if rename else name
+    return _IDENT_RE.sub(sub, expr)
+
+
+def _issue_source(rule: _Rule) -> str:
+    """Source building a rule's Issue from the local values its message names."""
+    _, names = _positional(rule.message)
+    return f"_Issue({rule.code!r}, ({''.join(name + ', ' for name in names)}))"
+
+
+def _with_early_exit(src: List[str], exit_lines: Tuple[str, ...]) -> List[str]:
+    """
+    Insert a return after every recorded issue once the record is certainly INVALID.
+
+    EDUCATIONAL NOTE - Early Exit:
+    More than two issues always classifies a record as INVALID (see
+    _QL_TABLE), and further checks cannot change that. Stopping there skips
+    the remaining comparisons, hash checks and messages for the records
+    that are going to be rejected anyway.
+    """
+    out = []
+    for line in src:
+        out.append(line)
+        if 'issues = _add(' in line:
+            indent = line[:len(line) - len(line.lstrip())]
+            out.append(f"{indent}if len(issues) > {_INVALID_ISSUE_COUNT}:")
+            out += [f"{indent}    {exit_line}" for exit_line in exit_lines]
+    return out
+
+
+def _missing_block(schema: _Schema, values: str, indent: str) -> List[str]:
+    """Source for the completeness check; values is a source tuple of the field values."""
+    names = tuple(f.name for f in schema.fields)
+    n = len(names)
+    return [
+        f"{indent}missing = [f for f, v in zip({names!r}, {values}) if v is None]",
+        f"{indent}issues = [_Issue({_missing_code(schema)!r}, (missing,))]",
+        f"{indent}metrics = {{'completeness': ({n} - len(missing)) / {n}}}",
+    ]
+
+
+def _single_source(schema: _Schema, constants: Dict[str, float], early_exit: bool) -> str:
+    """Source of the specialized single-record validator."""
+    names = [f.name for f in schema.fields]
+    src = [f"def single(record, now_ts):",
+           f"    _get = record.get"]
+    src += [f"    {name} = _get({name!r})" for name in names]
+    src += [f"    issues = None",
+            f"    warnings = None",
+            f"    if {' or '.join(f'{name} is None' for name in names)}:"]
+    src += _missing_block(schema, f"({', '.join(names)},)", "        ")
+    src += [f"    else:",
+            f"        metrics = {{'completeness': 1.0}}"]
+    for field in schema.fields:
+        if field.default is not None:
+            src += [f"    if {field.name} is None:",
+                    f"        {field.name} = {field.default!r}"]
+    for name, expr in schema.derived:
+        src.append(f"    {name} = {_inline(expr, constants)}")
+    for rule in schema.rules:
+        target = 'issues' if rule.severity == ISSUE else 'warnings'
+        src += [f"    if {_inline(rule.expr, constants)}:",
+                f"        {target} = _add({target}, {_issue_source(rule)})"]
+    for key, name in schema.metrics:
+        src.append(f"    metrics[{key!r}] = {name}")
+    tail = _HEX64_TOKEN_RE.sub(r'(\1 and _hex64(\1))', _inline(textwrap.dedent(schema.tail), constants))
+    src += [f"    {line}" if line else "" for line in tail.strip('\n').splitlines()]
+    src.append(f"    return issues, warnings, metrics")
+    if early_exit:
+        src = _with_early_exit(src, ("return issues, warnings, metrics",))
+    return '\n'.join(src) + '\n'
+
+
+def _flags_source(schema: _Schema, constants: Dict[str, float]) -> str:
+    """
+    Source of the NumPy range-check function.
+
+    It takes the numeric columns (in field order) and returns one int64 per
+    record with bit i set when rule i failed.
+    """
+    numeric = [f.name for f in schema.fields if f.default is not None]
+    args = ', '.join(f"{name}__c" for name in numeric)
+
+    src = [f"def flags({args}):"]
+    src += [f"    {name} = {name}__c" for name in numeric]
+    src += [f"    {name} = {_inline(expr, constants)}" for name, expr in schema.derived]
+    src.append("    return (" + "\n            | ".join(
+        f"({_inline(rule.expr, constants)}) * {1 << bit}" for bit, rule in enumerate(schema.rules)
+    ) + ")")
+    return '\n'.join(src) + '\n'
+
+
+def _batch_source(schema: _Schema, constants: Dict[str, float], early_exit: bool) -> str:
+    """Source of the specialized batch validator (NumPy range checks, per-row messages)."""
+    names = [f.name for f in schema.fields]
+    numeric = [f for f in schema.fields if f.default is not None]
+    numeric_names = {f.name for f in numeric}
+    derived_names = {name for name, _ in schema.derived}
+    hex_fields = sorted(set(_HEX64_TOKEN_RE.findall(schema.tail)))
+
+    def column(name):
+        return f"{name}__c" if name in numeric_names or name in derived_names else name
+
+    src = [f"def batch(records, now_ts):",
+           f"    rows = [tuple(map(r.get, {tuple(names)!r})) for r in records]",
+           f"    ({', '.join(f'{name}__v' for name in names)},) = zip(*rows)"]
+    for f in numeric:
+        dtype = '_np.float64' if f.dtype is np.float64 else '_np.int64'
+        src.append(f"    {f.name}__c = _column({f.name}__v, {f.default!r}, {dtype})")
+    for name, expr in schema.derived:
+        src.append(f"    {name}__c = {_inline(expr, constants, column)}")
+    src.append(f"    flags = _flags({', '.join(f'{f.name}__c' for f in numeric)}).tolist()")
+    for _, name in schema.metrics:
+        src.append(f"    {name}__l = {name}__c.tolist()")
+    for name in hex_fields:
+        src.append(f"    {name}__ok = _hex64_mask({name}__v).tolist()")
+
+    src += [f"    out = []",
+            f"    for i, row in enumerate(rows):",
+            f"        ({', '.join(names)},) = row",
+            f"        issues = None",
+            f"        warnings = None",
+            f"        if None in row:"]
+    src += _missing_block(schema, "row", "            ")
+    src += [f"        else:",
+            f"            metrics = {{'completeness': 1.0}}",
+            # Sparse path: messages are only built for rows a rule flagged
+            f"        bits = flags[i]",
+            f"        if bits:"]
+    for f in numeric:
+        src += [f"            if {f.name} is None:",
+                f"                {f.name} = {f.default!r}"]
+    for name, expr in schema.derived:
+        src.append(f"            {name} = {_inline(expr, constants)}")
+    for bit, rule in enumerate(schema.rules):
+        target = 'issues' if rule.severity == ISSUE else 'warnings'
+        src += [f"            if bits & {1 << bit}:",
+                f"                {target} = _add({target}, {_issue_source(rule)})"]
+    for key, name in schema.metrics:
+        src.append(f"        metrics[{key!r}] = {name}__l[i]")
+    tail = _HEX64_TOKEN_RE.sub(r'\1__ok[i]', _inline(textwrap.dedent(schema.tail), constants))
+    src += [f"        {line}" if line else "" for line in tail.strip('\n').splitlines()]
+    src += [f"        out.append((issues, warnings, metrics))",
+            f"    return out"]
+    if early_exit:
+        src = _with_early_exit(src, ("out.append((issues, warnings, metrics))", "continue"))
+    return '\n'.join(src) + '\n'
+
+
+# Set DEBUG_CODEGEN=true to log every generated function's source when it is
+# compiled. The source is also registered with linecache, so tracebacks and
+# inspect.getsource() show the generated lines, and _CompiledSchema.source
+# holds the whole module for one schema.
+DEBUG_CODEGEN = os.getenv('DEBUG_CODEGEN', 'false').lower() == 'true'
+
+
+def _exec(source: str, filename: str, namespace: Dict[str, Any]) -> Dict[str, Any]:
+    """Compile generated source, registering it with linecache for readable tracebacks."""
+    if DEBUG_CODEGEN:
+        logger.info(f"Generated {filename}:\n{source}")
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(schema: _Schema, constants: Tuple[Tuple[str, float], ...],
+                    early_exit: bool = False) -> _CompiledSchema:
+    """
+    Generate and compile the validators for one schema.
+
+    Cached per (schema, constant values, early_exit), so every DataValidator
+    instance with the same settings shares the same compiled functions.
+    """
+    constants = dict(constants)
+    namespace = {'_np': np, '_add': _add, '_Issue': Issue, '_column': _column, '_hex64': _HEX64_MATCH,
+                 '_hex64_mask': _hex64_mask, '_YEAR_S': _YEAR_S,
+                 '_normalize_timestamp': _normalize_timestamp, '_base58_signature': _BASE58_SIGNATURE}
+
+    sources = [_single_source(schema, constants, early_exit)]
+    _exec(sources[0], f"<validator {schema.name} single>", namespace)
+    if schema.batch:
+        sources += [_flags_source(schema, constants), _batch_source(schema, constants, early_exit)]
+        _exec(sources[1], f"<validator {schema.name} flags>", namespace)
+        namespace['_flags'] = namespace['flags']
+        _exec(sources[2], f"<validator {schema.name} batch>", namespace)
+    return _CompiledSchema(
+        single=namespace['single'],
+        batch=namespace.get('batch'),
+        source='\n'.join(sources)
+    )
+
 
 class QualityLevel(Enum):
     """
@@ -55,22 +669,36 @@ class QualityLevel(Enum):
     INVALID = "invalid"
 
 
-@dataclass
+# Quality level by (min(issue_count, 3), has_warnings). Built once so the
+# classification is a table lookup instead of a chain of branches; more than
+# two issues is INVALID, any issue is LOW, warnings alone are MEDIUM.
+_QL_TABLE = (
+    (QualityLevel.HIGH, QualityLevel.MEDIUM),
+    (QualityLevel.LOW, QualityLevel.LOW),
+    (QualityLevel.LOW, QualityLevel.LOW),
+    (QualityLevel.INVALID, QualityLevel.INVALID),
+)
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of a data validation check.
 
+    One of these is created per validated record, so it uses __slots__ instead
+    of a per-instance __dict__ (less memory and allocator work per result).
+
     Attributes:
         is_valid: Whether the data passed validation
         quality_level: Overall quality classification
-        issues: List of detected issues (empty if valid)
-        warnings: Non-critical observations
+        issues: Detected issues (an empty tuple if valid); str() gives the message
+        warnings: Non-critical observations (an empty tuple if none)
         metrics: Quantitative quality metrics
     """
     is_valid: bool
     quality_level: QualityLevel
-    issues: List[str]
-    warnings: List[str]
+    issues: Sequence[Issue]
+    warnings: Sequence[Issue]
     metrics: Dict[str, float]
 
 
@@ -85,6 +713,10 @@ class DataValidator:
     from various sources (Variety) maintains sufficient quality for
     extracting Value.
 
+    The checks themselves are declared in the module-level _*_SCHEMA
+    definitions; __init__ compiles them into specialized functions with this
+    class's thresholds inlined (subclasses may override the constants).
+
     Usage:
         validator = DataValidator()
         result = validator.validate_bitcoin_block(block_data)
@@ -104,16 +736,56 @@ class DataValidator:
     SOLANA_FEE_MIN_LAMPORTS = 5000      # Minimum fee (5000 lamports)
     SOLANA_TIMESTAMP_TOLERANCE_SECONDS = 60  # Tighter tolerance
 
-    def __init__(self):
-        """Initialize the validator with tracking for quality metrics."""
-        self.validation_counts = {
-            "total": 0,
-            "passed": 0,
-            "failed": 0,
-            "warnings": 0
+    def __init__(self, collect_all_issues: bool = False):
+        """
+        Initialize the validator with tracking for quality metrics.
+
+        Args:
+            collect_all_issues: Run every check even after a record has become
+                INVALID (more than two issues). Off by default for throughput;
+                turn it on when debugging to see the full list of issues. With
+                it off, issues, quality_score and metrics of INVALID records
+                only cover the checks that ran.
+        """
+        self.collect_all_issues = collect_all_issues
+        # total / passed / failed / warnings, indexed by the _IDX_* constants.
+        # A fixed array of unsigned 64-bit ints is a direct store per update
+        # instead of a string-keyed dict lookup.
+        self._counts = array('Q', [0] * 4)
+        # Batches merge their counts under this lock, once per batch, so the
+        # batch validators can be called from several threads
+        self._counts_lock = threading.Lock()
+
+        # Specialize every schema with this instance's thresholds; sets
+        # self._fast_<schema> (one record) and, for batch schemas,
+        # self._batch_<schema> (many)
+        constants = tuple(sorted(
+            (name, getattr(self, name)) for name in dir(type(self))
+            if name.isupper() and not name.startswith('_')
+            and isinstance(getattr(self, name), (int, float))
+        ))
+        for schema in _SCHEMAS:
+            compiled = _compile_schema(schema, constants, not collect_all_issues)
+            setattr(self, f'_fast_{schema.name}', compiled.single)
+            if compiled.batch is not None:
+                setattr(self, f'_batch_{schema.name}', compiled.batch)
+
+        # Clean Solana transaction results by status (see validate_solana_transaction_fast)
+        self._clean_sol_tx: Dict[str, ValidationResult] = {}
+
+    @property
+    def validation_counts(self) -> Dict[str, int]:
+        """Snapshot of the validation counters as a dict."""
+        counts = self._counts
+        return {
+            "total": counts[_IDX_TOTAL],
+            "passed": counts[_IDX_PASSED],
+            "failed": counts[_IDX_FAILED],
+            "warnings": counts[_IDX_WARNINGS]
         }
 
-    def validate_bitcoin_block(self, block_data: Dict[str, Any]) -> ValidationResult:
+    def validate_bitcoin_block(self, block_data: Dict[str, Any],
+                               now: Optional[Any] = None) -> ValidationResult:
         """
         Validate a Bitcoin block for data quality.
 
@@ -124,110 +796,15 @@ class DataValidator:
         4. Hash format: Block hash follows expected pattern
 
         Args:
-            block_data: Dictionary containing Bitcoin block fields
+            block_data: Dictionary containing Bitcoin block fields; timestamp is
+                        epoch seconds (datetime objects are still accepted)
+            now: Reference time for the temporal checks (epoch seconds or datetime; defaults to now)
 
         Returns:
             ValidationResult with quality assessment
         """
-        issues = []
-        warnings = []
-        metrics = {}
-
-        # === COMPLETENESS CHECK ===
-        # Verify all required fields are present
-        required_fields = [
-            'block_height', 'block_hash', 'timestamp', 'previous_block_hash',
-            'merkle_root', 'difficulty', 'nonce', 'size', 'weight', 'transaction_count'
-        ]
-
-        missing_fields = [f for f in required_fields if f not in block_data or block_data[f] is None]
-        if missing_fields:
-            issues.append(f"Missing required fields: {missing_fields}")
-
-        completeness_score = (len(required_fields) - len(missing_fields)) / len(required_fields)
-        metrics['completeness'] = completeness_score
-
-        # === ACCURACY CHECKS ===
-        # Block height must be non-negative
-        if block_data.get('block_height', -1) < 0:
-            issues.append(f"Invalid block_height: {block_data.get('block_height')}")
-
-        # Size and weight must be positive and within limits
-        size = block_data.get('size', 0)
-        weight = block_data.get('weight', 0)
-
-        if size <= 0:
-            issues.append(f"Invalid block size: {size}")
-        elif size > self.BITCOIN_BLOCK_SIZE_MAX:
-            warnings.append(f"Unusually large block size: {size} bytes")
-
-        if weight <= 0:
-            issues.append(f"Invalid block weight: {weight}")
-        elif weight > self.BITCOIN_BLOCK_SIZE_MAX:
-            warnings.append(f"Block weight exceeds expected max: {weight}")
-
-        # Difficulty must be positive
-        difficulty = block_data.get('difficulty', 0)
-        if difficulty < self.BITCOIN_DIFFICULTY_MIN:
-            issues.append(f"Invalid difficulty: {difficulty}")
-
-        # Transaction count sanity check
-        tx_count = block_data.get('transaction_count', 0)
-        if tx_count < 1:
-            warnings.append(f"Block has no transactions (coinbase missing?): {tx_count}")
-        elif tx_count > self.BITCOIN_TX_PER_BLOCK_MAX:
-            warnings.append(f"Unusually high transaction count: {tx_count}")
-
-        metrics['tx_count'] = tx_count
-
-        # === TEMPORAL VALIDITY ===
-        # Timestamp should be within reasonable range
-        timestamp = block_data.get('timestamp')
-        if timestamp:
-            now = datetime.now()
-            time_diff = abs((now - timestamp).total_seconds() / 3600)  # Hours
-
-            if timestamp > now + timedelta(hours=self.BITCOIN_TIMESTAMP_TOLERANCE_HOURS):
-                issues.append(f"Block timestamp is in the future: {timestamp}")
-            elif time_diff > 24 * 365:  # More than a year old
-                warnings.append(f"Block is very old: {timestamp}")
-
-            metrics['timestamp_age_hours'] = time_diff
-        else:
-            issues.append("Missing timestamp")
-
-        # === HASH FORMAT VALIDATION ===
-        # Bitcoin hashes are 64 hex characters (256 bits)
-        block_hash = block_data.get('block_hash', '')
-        if not self._is_valid_hash(block_hash, 64):
-            issues.append(f"Invalid block_hash format: {block_hash[:20]}...")
-
-        merkle_root = block_data.get('merkle_root', '')
-        if not self._is_valid_hash(merkle_root, 64):
-            warnings.append(f"Invalid merkle_root format")
-
-        # === CALCULATE OVERALL QUALITY ===
-        self.validation_counts['total'] += 1
-
-        if issues:
-            self.validation_counts['failed'] += 1
-            quality_level = QualityLevel.INVALID if len(issues) > 2 else QualityLevel.LOW
-        elif warnings:
-            self.validation_counts['warnings'] += 1
-            quality_level = QualityLevel.MEDIUM
-        else:
-            self.validation_counts['passed'] += 1
-            quality_level = QualityLevel.HIGH
-
-        metrics['quality_score'] = self._calculate_quality_score(issues, warnings)
-
-        return ValidationResult(
-            is_valid=len(issues) == 0,
-            quality_level=quality_level,
-            issues=issues,
-            warnings=warnings,
-            metrics=metrics
-        )
+        now_ts = _reference_ts(now)
+        return self._finish([self._fast_btc_block(block_data, now_ts)], counted=True)[0]
 
     def validate_bitcoin_transaction(self, tx_data: Dict[str, Any]) -> ValidationResult:
         """
@@ -239,56 +816,34 @@ class DataValidator:
         3. Input/output counts are positive
         4. Size and weight are reasonable
         """
-        issues = []
-        warnings = []
-        metrics = {}
-
-        # Completeness check
-        required_fields = ['tx_hash', 'block_height', 'fee', 'input_count', 'output_count']
-        missing = [f for f in required_fields if f not in tx_data or tx_data[f] is None]
-        if missing:
-            issues.append(f"Missing fields: {missing}")
-
-        metrics['completeness'] = (len(required_fields) - len(missing)) / len(required_fields)
+        return self._finish([self._fast_btc_tx(tx_data, None)])[0]
 
-        # Fee validation (can be 0 for coinbase transaction)
-        fee = tx_data.get('fee', -1)
-        if fee < 0:
-            issues.append(f"Negative fee: {fee}")
-        elif fee == 0:
-            warnings.append("Zero fee (coinbase transaction?)")
-
-        # Input/output counts
-        input_count = tx_data.get('input_count', 0)
-        output_count = tx_data.get('output_count', 0)
-
-        if input_count == 0 and output_count > 0:
-            # Coinbase transaction has no inputs
-            warnings.append("No inputs (coinbase transaction)")
-        elif input_count < 0 or output_count < 0:
-            issues.append(f"Invalid input/output counts: {input_count}/{output_count}")
+    def validate_bitcoin_transactions_batch(self, records: List[Dict[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate a batch of Bitcoin transactions (e.g. all sampled txs of one block).
 
-        if output_count == 0:
-            issues.append("Transaction has no outputs")
+        Performs the same checks as validate_bitcoin_transaction, with the fee and
+        input/output count checks vectorized over the whole batch and the tx_hash
+        formats checked as one hex matrix (see _hex64_mask).
 
-        # Hash format
-        tx_hash = tx_data.get('tx_hash', '')
-        if not self._is_valid_hash(tx_hash, 64):
-            issues.append(f"Invalid tx_hash format")
+        EDUCATIONAL NOTE - Validating at Cohort Granularity:
+        Records from the same API share structure, so it is cheaper to check a
+        whole column (all fees, all output counts) at once than to re-run the
+        full validator for each row. This is the same columnar idea ClickHouse
+        uses for storage - the data is processed one column at a time.
 
-        # Calculate quality
-        quality_level = self._determine_quality_level(issues, warnings)
-        metrics['quality_score'] = self._calculate_quality_score(issues, warnings)
+        Args:
+            records: List of transaction dictionaries as passed to validate_bitcoin_transaction
 
-        return ValidationResult(
-            is_valid=len(issues) == 0,
-            quality_level=quality_level,
-            issues=issues,
-            warnings=warnings,
-            metrics=metrics
-        )
+        Returns:
+            One ValidationResult per record, in the same order
+        """
+        if not records:
+            return []
+        return self._finish(self._batch_btc_tx(records, None))
 
-    def validate_solana_block(self, block_data: Dict[str, Any]) -> ValidationResult:
+    def validate_solana_block(self, block_data: Dict[str, Any],
+                              now: Optional[Any] = None) -> ValidationResult:
         """
         Validate a Solana block for data quality.
 
@@ -297,66 +852,11 @@ class DataValidator:
         2. Timestamp is reasonable
         3. Parent slot is less than current slot
         4. Transaction count within expected range
-        """
-        issues = []
-        warnings = []
-        metrics = {}
-
-        # Completeness
-        required_fields = ['slot', 'block_height', 'block_hash', 'timestamp',
-                          'parent_slot', 'transaction_count']
-        missing = [f for f in required_fields if f not in block_data or block_data[f] is None]
-        if missing:
-            issues.append(f"Missing fields: {missing}")
-
-        metrics['completeness'] = (len(required_fields) - len(missing)) / len(required_fields)
-
-        # Slot/height consistency
-        slot = block_data.get('slot', 0)
-        block_height = block_data.get('block_height', 0)
-        parent_slot = block_data.get('parent_slot', 0)
-
-        if block_height > slot:
-            issues.append(f"block_height ({block_height}) > slot ({slot})")
-
-        if parent_slot >= slot:
-            issues.append(f"parent_slot ({parent_slot}) >= slot ({slot})")
-
-        # Calculate skipped slots (indicates network health)
-        skipped_slots = slot - parent_slot - 1
-        if skipped_slots > 10:
-            warnings.append(f"Many skipped slots: {skipped_slots}")
-        metrics['skipped_slots'] = skipped_slots
-
-        # Timestamp validation
-        timestamp = block_data.get('timestamp')
-        if timestamp:
-            now = datetime.now()
-            if timestamp > now + timedelta(seconds=self.SOLANA_TIMESTAMP_TOLERANCE_SECONDS):
-                issues.append(f"Timestamp in future: {timestamp}")
-
-            age_seconds = (now - timestamp).total_seconds()
-            metrics['timestamp_age_seconds'] = age_seconds
-
-        # Transaction count
-        tx_count = block_data.get('transaction_count', 0)
-        if tx_count < 0:
-            issues.append(f"Negative transaction count: {tx_count}")
-        elif tx_count > self.SOLANA_TX_PER_BLOCK_MAX:
-            warnings.append(f"Very high transaction count: {tx_count}")
-
-        metrics['tx_count'] = tx_count
-
-        quality_level = self._determine_quality_level(issues, warnings)
-        metrics['quality_score'] = self._calculate_quality_score(issues, warnings)
 
-        return ValidationResult(
-            is_valid=len(issues) == 0,
-            quality_level=quality_level,
-            issues=issues,
-            warnings=warnings,
-            metrics=metrics
-        )
+        now optionally fixes the reference time for the timestamp check.
+        """
+        now_ts = _reference_ts(now)
+        return self._finish([self._fast_sol_block(block_data, now_ts)])[0]
 
     def validate_solana_transaction(self, tx_data: Dict[str, Any]) -> ValidationResult:
         """
@@ -367,72 +867,137 @@ class DataValidator:
         2. Fee is reasonable (minimum 5000 lamports)
         3. Status is valid ('success' or 'failed')
         """
-        issues = []
-        warnings = []
-        metrics = {}
-
-        # Completeness
-        required_fields = ['signature', 'slot', 'fee', 'status']
-        missing = [f for f in required_fields if f not in tx_data or tx_data[f] is None]
-        if missing:
-            issues.append(f"Missing fields: {missing}")
+        return self._finish([self._fast_sol_tx(tx_data, None)])[0]
 
-        metrics['completeness'] = (len(required_fields) - len(missing)) / len(required_fields)
+    def validate_solana_transaction_fast(self, tx_row: Any) -> ValidationResult:
+        """
+        Validate a Solana transaction row (attribute access, e.g. SolanaTxRow).
+
+        EDUCATIONAL NOTE - Caching the Happy Path:
+        Nearly every transaction in a getBlock response is well formed, and a
+        clean transaction's result depends on nothing but its status: no
+        issues, no warnings, completeness 1.0 and is_failed from the status.
+        So once a transaction with a given status has passed the full checks,
+        later ones only need the cheap preconditions for a clean result
+        (signature is base58, slot present, fee at least the minimum) and can
+        share that first result. Anything that misses the preconditions goes
+        through validate_solana_transaction, so it gets exactly the issues
+        and warnings the full checks report.
+
+        The cache holds at most one entry per valid status ('success',
+        'failed'). Results from it are shared between calls and must be
+        treated as read-only.
+        """
+        signature = tx_row.signature
+        clean_shape = (
+            tx_row.slot is not None
+            and tx_row.fee >= self.SOLANA_FEE_MIN_LAMPORTS
+            and signature and _BASE58_SIGNATURE(signature)
+        )
+        if clean_shape:
+            cached = self._clean_sol_tx.get(tx_row.status)
+            if cached is not None:
+                return cached
+
+        result = self.validate_solana_transaction(tx_row._asdict())
+        if clean_shape and not result.issues and not result.warnings:
+            self._clean_sol_tx[tx_row.status] = result
+        return result
+
+    def validate_block_with_txs(self, block_data: Dict[str, Any], tx_rows: Sequence[Any],
+                                now: Optional[Any] = None) -> Tuple[ValidationResult, List[ValidationResult]]:
+        """
+        Validate a Solana block and the transaction rows taken from it in one call.
 
-        # Fee validation
-        fee = tx_data.get('fee', -1)
-        if fee < 0:
-            issues.append(f"Negative fee: {fee}")
-        elif fee < self.SOLANA_FEE_MIN_LAMPORTS and fee > 0:
-            warnings.append(f"Fee below expected minimum: {fee} lamports")
+        EDUCATIONAL NOTE - Fusing Block and Transaction Checks:
+        Validating a block and then each of its ~50 sampled transactions
+        separately means ~51 calls, each re-reading fields the block already
+        answered - every transaction carries the block's slot. Here the
+        block is validated first and the shared slot check is done once;
+        the per-transaction loop then only looks at what differs between
+        transactions (signature, fee, status) and serves clean ones from the
+        same happy-path cache as validate_solana_transaction_fast.
 
-        # Status validation
-        status = tx_data.get('status', '')
-        if status not in ('success', 'failed'):
-            issues.append(f"Invalid status: {status}")
+        Args:
+            block_data: Block dictionary as passed to validate_solana_block
+            tx_rows: Transaction rows with attribute access (e.g. SolanaTxRow)
+                that share the block's slot
+            now: Optional reference time for the block timestamp check
 
-        if status == 'failed':
-            metrics['is_failed'] = 1.0
-        else:
-            metrics['is_failed'] = 0.0
+        Returns:
+            (block result, one result per transaction row in the same order).
+            Clean transaction results are shared; treat them as read-only.
+        """
+        block_result = self._finish([self._fast_sol_block(block_data, _reference_ts(now))])[0]
+
+        slot_present = block_data.get('slot') is not None
+        fee_min = self.SOLANA_FEE_MIN_LAMPORTS
+        clean = self._clean_sol_tx
+        tx_results = []
+        for tx_row in tx_rows:
+            signature = tx_row.signature
+            result = None
+            if slot_present and tx_row.fee >= fee_min and signature and _BASE58_SIGNATURE(signature):
+                result = clean.get(tx_row.status)
+            if result is None:
+                result = self.validate_solana_transaction_fast(tx_row)
+            tx_results.append(result)
+        return block_result, tx_results
+
+    def _finish(self, raw: List[tuple], counted: bool = False) -> List[ValidationResult]:
+        """
+        Wrap generated (issues, warnings, metrics) triples in ValidationResults.
 
-        # Signature format (should be base58, typically 87-88 characters)
-        signature = tx_data.get('signature', '')
-        if len(signature) < 80 or len(signature) > 90:
-            warnings.append(f"Unusual signature length: {len(signature)}")
+        When counted, the batch's pass/fail/warning counts are tallied locally
+        and merged into the shared counters once (see _merge_counts).
+        """
+        build = self._build_result
+        if not counted:
+            return [build(*r) for r in raw]
+
+        counts = [len(raw), 0, 0, 0]
+        results = []
+        for issues, warnings, metrics in raw:
+            if issues:
+                counts[_IDX_FAILED] += 1
+            elif warnings:
+                counts[_IDX_WARNINGS] += 1
+            else:
+                counts[_IDX_PASSED] += 1
+            results.append(build(issues, warnings, metrics))
+        self._merge_counts(counts)
+        return results
+
+    def _merge_counts(self, counts: List[int]) -> None:
+        """Add one batch's total/passed/failed/warnings counts to the shared counters."""
+        with self._counts_lock:
+            for idx, n in enumerate(counts):
+                self._counts[idx] += n
+
+    def _build_result(self, issues: Optional[List[Issue]], warnings: Optional[List[Issue]],
+                      metrics: Dict[str, float]) -> ValidationResult:
+        """
+        Classify one record's issues/warnings and wrap them in a ValidationResult.
 
-        quality_level = self._determine_quality_level(issues, warnings)
+        issues/warnings are None when nothing was recorded; passing records then
+        share the module-level empty tuple instead of two fresh lists each.
+        """
+        issues = issues or _EMPTY
+        warnings = warnings or _EMPTY
         metrics['quality_score'] = self._calculate_quality_score(issues, warnings)
-
         return ValidationResult(
             is_valid=len(issues) == 0,
-            quality_level=quality_level,
+            quality_level=self._determine_quality_level(issues, warnings),
             issues=issues,
             warnings=warnings,
             metrics=metrics
         )
 
-    def _is_valid_hash(self, hash_str: str, expected_length: int) -> bool:
-        """Check if a string is a valid hexadecimal hash of expected length."""
-        if not hash_str or len(hash_str) != expected_length:
-            return False
-        try:
-            int(hash_str, 16)
-            return True
-        except ValueError:
-            return False
-
-    def _determine_quality_level(self, issues: List[str], warnings: List[str]) -> QualityLevel:
+    def _determine_quality_level(self, issues: Sequence[Issue], warnings: Sequence[Issue]) -> QualityLevel:
         """Determine overall quality level based on issues and warnings."""
-        if len(issues) > 2:
-            return QualityLevel.INVALID
-        elif issues:
-            return QualityLevel.LOW
-        elif warnings:
-            return QualityLevel.MEDIUM
-        return QualityLevel.HIGH
-
-    def _calculate_quality_score(self, issues: List[str], warnings: List[str]) -> float:
+        return _QL_TABLE[min(len(issues), 3)][1 if warnings else 0]
+
+    def _calculate_quality_score(self, issues: Sequence[Issue], warnings: Sequence[Issue]) -> float:
         """
         Calculate a numeric quality score from 0.0 to 1.0.
 
@@ -453,20 +1018,142 @@ class DataValidator:
 
         Returns statistics useful for monitoring data quality over time.
         """
-        total = self.validation_counts['total']
+        total, passed, failed, with_warnings = self._counts
         if total == 0:
             return {"message": "No validations performed yet"}
 
         return {
             "total_validations": total,
-            "passed": self.validation_counts['passed'],
-            "failed": self.validation_counts['failed'],
-            "with_warnings": self.validation_counts['warnings'],
-            "pass_rate": round(self.validation_counts['passed'] / total * 100, 2),
-            "fail_rate": round(self.validation_counts['failed'] / total * 100, 2)
+            "passed": passed,
+            "failed": failed,
+            "with_warnings": with_warnings,
+            "pass_rate": round(passed / total * 100, 2),
+            "fail_rate": round(failed / total * 100, 2)
         }
 
 
+# data_quality insert columns; rows are queued as tuples in this order
+_DQ_COLUMNS = [
+    'detected_at', 'source', 'record_type', 'record_id', 'quality_level',
+    'quality_score', 'issue_count', 'warning_count', 'issues', 'warnings'
+]
+
+
+class QualityLogger(threading.Thread):
+    """
+    Background thread that writes data_quality rows to ClickHouse in batches.
+
+    EDUCATIONAL NOTE - Producer/Consumer Decoupling:
+    Validation is CPU work; inserting audit rows is network I/O. If the
+    validating code inserted the rows itself, every ClickHouse round trip
+    would stall the collector. Instead log_quality_issue only puts the row
+    on a bounded queue (microseconds), and this daemon thread drains the
+    queue into batched INSERTs. Batching matters for the database too:
+    each INSERT creates a new MergeTree part, so one insert of many rows
+    is far cheaper than many single-row inserts.
+
+    The queue is bounded so a ClickHouse outage cannot grow memory without
+    limit: when it is full new rows are dropped and counted (see dropped).
+    """
+
+    QUEUE_SIZE = 10_000         # Rows waiting for insert before new ones are dropped
+    BATCH_ROWS = 1000           # Max rows per INSERT
+    BATCH_WAIT_SECONDS = 0.1    # How long a batch waits for more rows after its first
+
+    def __init__(self):
+        super().__init__(name='quality-logger', daemon=True)
+        self.queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        # Serializes inserts between the worker and flush()
+        self._insert_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        # Most recent client seen; the worker and the atexit hook insert with it
+        self._client = None
+        # clickhouse_connect clients run every query in one server-side
+        # session, which allows only one query at a time. Inserts from this
+        # thread use their own session so they never collide with the
+        # collectors' queries on the same client.
+        self._insert_settings = {'session_id': f'quality-logger-{uuid.uuid4().hex}'}
+
+    def put(self, row: tuple, client) -> None:
+        """Queue one row for insert without blocking; drops it if the queue is full."""
+        self._client = client
+        if not self.is_alive():
+            self._start_once()
+        try:
+            self.queue.put_nowait(row)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                first = self.dropped == 1
+            if first:
+                logger.warning("data_quality queue is full; dropping quality rows")
+
+    def _start_once(self) -> None:
+        # Started on first use so importing the module does not spawn a thread
+        with self._start_lock:
+            if not self.is_alive() and self.ident is None:
+                self.start()
+
+    def run(self) -> None:
+        self._drain_loop()
+
+    def _drain_loop(self) -> None:
+        """Wait for a row, gather more for up to BATCH_WAIT_SECONDS, insert them together."""
+        while True:
+            row = self.queue.get()
+            with self._insert_lock:
+                rows = [row]
+                deadline = time.monotonic() + self.BATCH_WAIT_SECONDS
+                while len(rows) < self.BATCH_ROWS:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        rows.append(self.queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                self._insert(rows, self._client)
+
+    def _drain_now(self) -> List[tuple]:
+        rows = []
+        while True:
+            try:
+                rows.append(self.queue.get_nowait())
+            except queue.Empty:
+                return rows
+
+    def _insert(self, rows: List[tuple], client) -> None:
+        # One failed insert drops one batch; it is logged, never raised
+        if not rows or client is None:
+            return
+        try:
+            client.insert('data_quality', rows, column_names=_DQ_COLUMNS,
+                          settings=self._insert_settings)
+        except Exception as e:
+            logger.error(f"Failed to log {len(rows)} quality issues: {e}")
+
+    def flush(self, client=None) -> None:
+        """
+        Insert every queued row now, on the calling thread (used on shutdown).
+
+        Waits for a batch the worker is currently inserting, then writes the
+        rest of the queue in BATCH_ROWS sized inserts.
+        """
+        client = client or self._client
+        with self._insert_lock:
+            rows = self._drain_now()
+            for i in range(0, len(rows), self.BATCH_ROWS):
+                self._insert(rows[i:i + self.BATCH_ROWS], client)
+        if self.dropped:
+            logger.warning(f"{self.dropped} data_quality rows were dropped (queue full)")
+
+
+_quality_log = QualityLogger()
+atexit.register(_quality_log.flush)
+
+
 def log_quality_issue(source: str, record_type: str, record_id: str,
                       result: ValidationResult, client) -> None:
     """
@@ -477,6 +1164,10 @@ def log_quality_issue(source: str, record_type: str, record_id: str,
     - Root cause analysis of data issues
     - Alerting on quality degradation
 
+    The row is queued and written in batches by a background thread (see
+    QualityLogger), so this never waits on ClickHouse; call
+    flush_quality_issues() to force queued rows out.
+
     Args:
         source: The blockchain source (bitcoin, solana, ethereum)
         record_type: Type of record (block, transaction)
@@ -487,18 +1178,32 @@ def log_quality_issue(source: str, record_type: str, record_id: str,
     if not result.issues and not result.warnings:
         return  # Only log if there are issues
 
-    try:
-        client.insert('data_quality', [{
-            'detected_at': datetime.now(),
-            'source': source,
-            'record_type': record_type,
-            'record_id': record_id,
-            'quality_level': result.quality_level.value,
-            'quality_score': result.metrics.get('quality_score', 0.0),
-            'issue_count': len(result.issues),
-            'warning_count': len(result.warnings),
-            'issues': '; '.join(result.issues) if result.issues else '',
-            'warnings': '; '.join(result.warnings) if result.warnings else ''
-        }])
-    except Exception as e:
-        logger.error(f"Failed to log quality issue: {e}")
+    # Values in _DQ_COLUMNS order
+    _quality_log.put((
+        datetime.now(),
+        source,
+        record_type,
+        record_id,
+        result.quality_level.value,
+        result.metrics.get('quality_score', 0.0),
+        len(result.issues),
+        len(result.warnings),
+        # The only point where Issue messages are formatted
+        '; '.join(map(str, result.issues)),
+        '; '.join(map(str, result.warnings))
+    ), client)
+
+
+def flush_quality_issues(client=None, force: bool = True) -> None:
+    """
+    Write queued data_quality rows to ClickHouse.
+
+    The QualityLogger thread already inserts rows within BATCH_WAIT_SECONDS,
+    so only a forced flush (e.g. on shutdown) does anything here.
+
+    Args:
+        client: ClickHouse client (defaults to the last one passed to log_quality_issue)
+        force: Insert the queued rows now, on the calling thread
+    """
+    if force:
+        _quality_log.flush(client)
@@ -0,0 +1,142 @@
+"""
+Tests for the /start and /stop collection lifecycle in main.py.
+
+ClickHouse is replaced by an in-memory fake and the collectors are
+disabled, so only the control flow is exercised: is_collecting and
+collection_task must always be reset when a run ends, however it ends,
+or every later /start is rejected until the process restarts.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+class FakeClickHouse:
+    """Records inserts; answers every query with a single zero."""
+
+    class _Result:
+        result_rows = [[0]]
+        result_columns = []
+
+    def __init__(self):
+        self.inserts = []
+
+    def query(self, query, *args, **kwargs):
+        return self._Result()
+
+    def command(self, query, *args, **kwargs):
+        pass
+
+    def insert(self, table, data, **kwargs):
+        self.inserts.append((table, data, kwargs.get('column_names')))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Fresh lifecycle state with ClickHouse replaced by a FakeClickHouse."""
+    client = FakeClickHouse()
+    monkeypatch.setenv('COLLECTION_INTERVAL_SECONDS', '1')
+    monkeypatch.setattr(main, 'get_clickhouse_client', lambda: client)
+    monkeypatch.setattr(main, '_shared_client', None)
+    monkeypatch.setattr(main, 'is_collecting', False)
+    monkeypatch.setattr(main, 'collection_task', None)
+    # asyncio.Event binds to the loop it is first waited on; each test runs its own loop
+    monkeypatch.setattr(main, 'stop_event', asyncio.Event())
+    monkeypatch.setattr(main.bitcoin_collector, 'enabled', False)
+    monkeypatch.setattr(main.solana_collector, 'enabled', False)
+    return client
+
+
+def running_states(client):
+    """is_running value of every collection_state row written, in order."""
+    return [data[0][1] for table, data, _ in client.inserts if table == 'collection_state']
+
+
+def test_start_and_stop(fake_client):
+    async def scenario():
+        await main.start_collection()
+        await asyncio.sleep(0.1)
+        assert main.is_collecting
+
+        with pytest.raises(HTTPException) as exc:
+            await main.start_collection()
+        assert exc.value.status_code == 400
+
+        await main.stop_collection()
+        assert not main.is_collecting
+        assert main.collection_task is None
+
+        with pytest.raises(HTTPException) as exc:
+            await main.stop_collection()
+        assert exc.value.status_code == 400
+
+    asyncio.run(scenario())
+    # Marked running on start, stopped on the way out
+    assert running_states(fake_client)[0] is True
+    assert running_states(fake_client)[-1] is False
+
+
+def test_can_restart_after_stop(fake_client):
+    async def scenario():
+        for _ in range(2):
+            await main.start_collection()
+            await asyncio.sleep(0.05)
+            await main.stop_collection()
+        assert not main.is_collecting
+
+    asyncio.run(scenario())
+    assert running_states(fake_client).count(True) >= 2
+
+
+def test_unreachable_clickhouse_does_not_block_restart(fake_client, monkeypatch):
+    def unreachable():
+        raise ConnectionError("ClickHouse is down")
+
+    monkeypatch.setattr(main, 'get_clickhouse_client', unreachable)
+
+    async def scenario():
+        await main.start_collection()
+        await asyncio.sleep(0.1)
+        # The run ended on its own; its finally must have reset the flag
+        assert main.collection_task.done()
+        assert not main.is_collecting
+
+        # ClickHouse is back: a new run starts normally
+        monkeypatch.setattr(main, 'get_clickhouse_client', lambda: fake_client)
+        await main.start_collection()
+        await asyncio.sleep(0.05)
+        assert main.is_collecting
+        await main.stop_collection()
+        assert not main.is_collecting
+
+    asyncio.run(scenario())
+    assert running_states(fake_client) == [True, False]
+
+
+def test_stop_resets_state_when_the_run_fails(fake_client, monkeypatch):
+    async def failing_run():
+        await main.stop_event.wait()
+        raise RuntimeError("collection run failed")
+
+    monkeypatch.setattr(main, 'collect_data', failing_run)
+
+    async def scenario():
+        await main.start_collection()
+        await asyncio.sleep(0)
+        # The task's error is logged, not raised to the /stop caller
+        await main.stop_collection()
+        assert not main.is_collecting
+        assert main.collection_task is None
+
+        await main.start_collection()
+        assert main.is_collecting
+        await main.stop_collection()
+
+    asyncio.run(scenario())